@@ -10,19 +10,92 @@ Performative expression shows dimensional dissonance.
 """
 
 import numpy as np
-from typing import Dict, Optional
-from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+from dataclasses import dataclass, field
 from rose_glass_test import PatternVisibility
 
 
-@dataclass
+# Pattern types in classification priority order; index = batch pattern_type_code
+PATTERN_TYPES = ("performative", "bureaucratic", "authentic", "exploratory", "fragmented")
+_PATTERN_TYPE_LABELS = np.array(PATTERN_TYPES)
+
+# Explanation templates by pattern type; each takes the one figure it quotes
+_EXPLANATIONS = {
+    "performative": (
+        "High social architecture (f={:.2f}) without wisdom/emotional depth. "
+        "Pattern optimized for social signaling rather than genuine expression."
+    ),
+    "bureaucratic": (
+        "High logical consistency (Ψ={:.2f}) without depth/emotion. "
+        "Institutional precision, not personal expression."
+    ),
+    "authentic": (
+        "Strong dimensional harmony ({:.2f}). All dimensions move together—"
+        "structure, depth, emotion, and connection integrated. "
+        "Pattern reflects genuine unified expression."
+    ),
+    "exploratory": (
+        "Moderate harmony ({:.2f}). Thoughts forming, patterns emerging. "
+        "Not fully integrated but not performative—authentic exploration."
+    ),
+    "fragmented": (
+        "Low dimensional harmony ({:.2f}). Dimensions disconnected. "
+        "Could indicate crisis, experimentation, or early-stage formation."
+    ),
+}
+
+
+@dataclass(slots=True, init=False)
 class AuthenticitySignature:
-    """Analysis of pattern authenticity"""
+    """
+    Analysis of pattern authenticity
+
+    Built with an explicit explanation, or by from_template, which defers
+    formatting the pattern type's explanation until it is read.
+    """
     authenticity_score: float  # 0-1, higher = more authentic
     confidence: float  # 0-1, based on pattern strength
     pattern_type: str  # authentic, performative, bureaucratic, exploratory
     dimensional_harmony: float  # Cross-dimensional correlation
-    explanation: str
+    _explanation: Optional[str] = field(default=None, repr=False)  # Explicit text, if given
+    _explain_value: float = field(default=0.0, repr=False)  # Figure quoted by the template
+
+    def __init__(self, authenticity_score: float, confidence: float, pattern_type: str,
+                 dimensional_harmony: float, explanation: Optional[str] = None):
+        self.authenticity_score = authenticity_score
+        self.confidence = confidence
+        self.pattern_type = pattern_type
+        self.dimensional_harmony = dimensional_harmony
+        self._explanation = explanation
+        self._explain_value = 0.0
+
+    @classmethod
+    def from_template(cls, authenticity_score: float, confidence: float, pattern_type: str,
+                      dimensional_harmony: float, explain_value: float) -> 'AuthenticitySignature':
+        """Signature whose explanation is pattern_type's template quoting explain_value"""
+        signature = cls(authenticity_score, confidence, pattern_type, dimensional_harmony)
+        signature._explain_value = explain_value
+        return signature
+
+    @property
+    def explanation(self) -> str:
+        """Human-readable explanation, formatted only when requested"""
+        if self._explanation is not None:
+            return self._explanation
+        return _EXPLANATIONS[self.pattern_type].format(self._explain_value)
+
+
+@dataclass
+class AuthenticityBatch:
+    """Struct-of-arrays authenticity analysis for many patterns at once"""
+    authenticity_score: np.ndarray  # (N,) 0-1, higher = more authentic
+    confidence: np.ndarray  # (N,) 0-1, based on pattern strength
+    pattern_type: np.ndarray  # (N,) pattern type labels
+    pattern_type_code: np.ndarray  # (N,) int index into PATTERN_TYPES
+    dimensional_harmony: np.ndarray  # (N,) cross-dimensional correlation
+
+    def __len__(self) -> int:
+        return len(self.authenticity_score)
 
 
 class AuthenticityAnalyzer:
@@ -46,6 +119,13 @@ class AuthenticityAnalyzer:
             'bureaucratic_engagement': 0.3 # Low q+ρ threshold
         }
 
+        # Flattened copies of the thresholds for the classification hot path
+        self._authentic_harmony = self.thresholds['authentic_harmony']
+        self._performative_f = self.thresholds['performative_f']
+        self._performative_depth = self.thresholds['performative_depth']
+        self._bureaucratic_psi = self.thresholds['bureaucratic_psi']
+        self._bureaucratic_engagement = self.thresholds['bureaucratic_engagement']
+
     def analyze(self, visibility: PatternVisibility) -> AuthenticitySignature:
         """
         Analyze pattern authenticity
@@ -63,17 +143,90 @@ class AuthenticityAnalyzer:
         confidence = min(1.0, visibility.pattern_intensity)
 
         # Classify pattern type
-        pattern_type, explanation = self._classify_pattern(visibility, harmony)
+        pattern_type, explain_value = self._classify_pattern(visibility, harmony)
 
         # Calculate authenticity score
         authenticity_score = self._calculate_authenticity(visibility, harmony, pattern_type)
 
-        return AuthenticitySignature(
+        return AuthenticitySignature.from_template(
             authenticity_score=authenticity_score,
             confidence=confidence,
             pattern_type=pattern_type,
             dimensional_harmony=harmony,
-            explanation=explanation
+            explain_value=explain_value
+        )
+
+    def analyze_batch(self, visibilities: Sequence[PatternVisibility]) -> AuthenticityBatch:
+        """
+        Analyze many patterns in one vectorized pass
+
+        Applies the same harmony, classification and scoring rules as
+        analyze(), but over (N,) arrays instead of one record at a time.
+        Explanations are not generated; use analyze() for those.
+
+        Args:
+            visibilities: PatternVisibility records from RoseGlassSimple
+
+        Returns:
+            AuthenticityBatch with one entry per input record
+        """
+        data = np.empty((len(visibilities), 6))
+        for i, vis in enumerate(visibilities):
+            data[i] = (vis.psi, vis.rho, vis.q_optimized, vis.f, vis.q, vis.pattern_intensity)
+        psi, rho, q_opt, f, q_raw, intensity = data.T
+
+        # Dimensional harmony - see _calculate_dimensional_harmony
+        dimensions = data[:, :4]
+        dimension_mean = dimensions.mean(axis=1)
+        dimension_variance = dimensions.var(axis=1)
+        harmony = np.clip(1.0 - dimension_variance * 3.0, 0.0, 1.0)
+        aligned = (psi > 0.7) & (rho > 0.7) & (q_opt > 0.6)
+        harmony = np.where(aligned, np.minimum(1.0, harmony * 1.2), harmony)
+        dissonant = (f > 0.6) & (q_raw > 0.6) & (rho < 0.4)
+        harmony = np.where(dissonant, harmony * 0.5, harmony)
+        empty = (dimension_mean < 0.3) & (dimension_variance < 0.05)
+        harmony = np.where(empty, 0.2, harmony)
+
+        codes = self.classify_batch(psi, rho, q_opt, f, harmony)
+
+        # Authenticity score - see _calculate_authenticity (choices in PATTERN_TYPES order)
+        depth = (rho + q_opt) / 2
+        authenticity_score = np.choose(codes, [
+            0.2 + f * 0.2,
+            0.3 + psi * 0.2,
+            np.minimum(1.0, harmony + np.minimum(0.3, depth * 0.3)),
+            0.5 + harmony * 0.3,
+            harmony * 0.5
+        ])
+
+        return AuthenticityBatch(
+            authenticity_score=authenticity_score,
+            confidence=np.minimum(1.0, intensity),
+            pattern_type=_PATTERN_TYPE_LABELS[codes],
+            pattern_type_code=codes,
+            dimensional_harmony=harmony
+        )
+
+    def classify_batch(self, psi: np.ndarray, rho: np.ndarray, q_opt: np.ndarray,
+                       f: np.ndarray, harmony: np.ndarray) -> np.ndarray:
+        """
+        Classify many patterns at once as integer codes into PATTERN_TYPES
+
+        Masks are made exclusive in _classify_pattern's priority order.
+        """
+        depth = (rho + q_opt) / 2
+        performative = (f > self._performative_f) & (depth < self._performative_depth)
+        bureaucratic = (~performative &
+                        (psi > self._bureaucratic_psi) &
+                        (depth < self._bureaucratic_engagement))
+        authentic = ~(performative | bureaucratic) & (harmony > self._authentic_harmony)
+        exploratory = (~(performative | bureaucratic | authentic) &
+                       (harmony > 0.4) & (harmony < 0.7))
+
+        return np.select(
+            [performative, bureaucratic, authentic, exploratory],
+            [0, 1, 2, 3],
+            default=4
         )
 
     def _calculate_dimensional_harmony(self, vis: PatternVisibility) -> float:
@@ -84,14 +237,16 @@ class AuthenticityAnalyzer:
         Low harmony = dimensions disconnected (performed)
         """
         # Core dimensions for harmony calculation
-        dimensions = np.array([vis.psi, vis.rho, vis.q_optimized, vis.f])
+        # (plain scalar math - NumPy dispatch costs more than the work on 4 values)
+        p, r, q, f = vis.psi, vis.rho, vis.q_optimized, vis.f
 
         # Calculate variance - low variance might indicate either:
         # 1. All dimensions low (empty pattern) - NOT harmonious
         # 2. All dimensions high (integrated) - harmonious
         # 3. All dimensions medium (forming) - moderately harmonious
-        dimension_variance = np.var(dimensions)
-        dimension_mean = np.mean(dimensions)
+        dimension_mean = (p + r + q + f) * 0.25
+        dimension_variance = ((p - dimension_mean) ** 2 + (r - dimension_mean) ** 2 +
+                              (q - dimension_mean) ** 2 + (f - dimension_mean) ** 2) * 0.25
 
         # Penalize low-mean low-variance (all dimensions near zero)
         if dimension_mean < 0.3 and dimension_variance < 0.05:
@@ -112,55 +267,36 @@ class AuthenticityAnalyzer:
         if vis.f > 0.6 and vis.q > 0.6 and vis.rho < 0.4:
             harmony *= 0.5  # Penalize dissonance
 
-        return float(harmony)
+        return harmony
 
-    def _classify_pattern(self, vis: PatternVisibility, harmony: float) -> tuple[str, str]:
+    def _classify_pattern(self, vis: PatternVisibility, harmony: float) -> tuple[str, float]:
         """
         Classify pattern type based on dimensional configuration
 
-        Returns: (pattern_type, explanation)
+        Returns: (pattern_type, explanation_value) - the value is the figure
+        quoted in that type's explanation template
         """
+        # Depth (ρ+q average) gates both the performative and bureaucratic checks
+        depth = (vis.rho + vis.q_optimized) / 2
+
         # PERFORMATIVE: High f, low depth (ρ+q)
-        if (vis.f > self.thresholds['performative_f'] and
-            (vis.rho + vis.q_optimized) / 2 < self.thresholds['performative_depth']):
-            return (
-                "performative",
-                f"High social architecture (f={vis.f:.2f}) without wisdom/emotional depth. "
-                f"Pattern optimized for social signaling rather than genuine expression."
-            )
+        if vis.f > self._performative_f and depth < self._performative_depth:
+            return "performative", vis.f
 
         # BUREAUCRATIC: High Ψ, low engagement (q+ρ)
-        if (vis.psi > self.thresholds['bureaucratic_psi'] and
-            (vis.q_optimized + vis.rho) / 2 < self.thresholds['bureaucratic_engagement']):
-            return (
-                "bureaucratic",
-                f"High logical consistency (Ψ={vis.psi:.2f}) without depth/emotion. "
-                f"Institutional precision, not personal expression."
-            )
+        if vis.psi > self._bureaucratic_psi and depth < self._bureaucratic_engagement:
+            return "bureaucratic", vis.psi
 
         # AUTHENTIC: High harmony + balanced dimensions
-        if harmony > self.thresholds['authentic_harmony']:
-            return (
-                "authentic",
-                f"Strong dimensional harmony ({harmony:.2f}). All dimensions move together—"
-                f"structure, depth, emotion, and connection integrated. "
-                f"Pattern reflects genuine unified expression."
-            )
+        if harmony > self._authentic_harmony:
+            return "authentic", harmony
 
         # EXPLORATORY: Moderate harmony, forming patterns
         if 0.4 < harmony < 0.7:
-            return (
-                "exploratory",
-                f"Moderate harmony ({harmony:.2f}). Thoughts forming, patterns emerging. "
-                f"Not fully integrated but not performative—authentic exploration."
-            )
+            return "exploratory", harmony
 
         # FRAGMENTED: Low harmony
-        return (
-            "fragmented",
-            f"Low dimensional harmony ({harmony:.2f}). Dimensions disconnected. "
-            f"Could indicate crisis, experimentation, or early-stage formation."
-        )
+        return "fragmented", harmony
 
     def _calculate_authenticity(self, vis: PatternVisibility, harmony: float,
                                 pattern_type: str) -> float:
@@ -246,7 +382,7 @@ both the same? But why does it feel different? Is it just the medium?"""
         print(f"Text: {text[:100]}...")
 
         # Analyze with Rose Glass
-        visibility = glass.analyze_text(text)
+        visibility = glass.analyze_text_cached(text)
 
         # Analyze authenticity
         auth = analyzer.analyze(visibility)
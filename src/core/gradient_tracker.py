@@ -9,14 +9,14 @@ human performance monitoring (detecting stress escalation).
 Addresses Gap 5 from testing analysis.
 """
 
+import math
 import numpy as np
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime
-from collections import deque
+from typing import ClassVar, List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternSnapshot:
     """Single snapshot of pattern state at a point in time"""
     timestamp: datetime
@@ -32,25 +32,28 @@ class PatternSnapshot:
         return np.array([self.psi, self.rho, self.q, self.f, self.tau, self.pattern_intensity])
 
 
-@dataclass
+# Vector layout shared by snapshots, gradients and the tracker's ring buffer
+DIMENSION_LABELS = ['psi', 'rho', 'q', 'f', 'tau', 'intensity']
+_LABEL_IDX = {label: i for i, label in enumerate(DIMENSION_LABELS)}
+
+
+@dataclass(slots=True)
 class PatternGradient:
     """Gradient (rate of change) of pattern dimensions"""
     velocity: np.ndarray  # First derivative (rate of change)
     acceleration: np.ndarray  # Second derivative (change in rate)
-    dimension_labels: List[str] = field(default_factory=lambda: ['psi', 'rho', 'q', 'f', 'tau', 'intensity'])
+    dimension_labels: ClassVar[List[str]] = DIMENSION_LABELS
 
     def get_dimension_velocity(self, dimension: str) -> float:
         """Get velocity for a specific dimension"""
-        idx = self.dimension_labels.index(dimension)
-        return float(self.velocity[idx])
+        return float(self.velocity[_LABEL_IDX[dimension]])
 
     def get_dimension_acceleration(self, dimension: str) -> float:
         """Get acceleration for a specific dimension"""
-        idx = self.dimension_labels.index(dimension)
-        return float(self.acceleration[idx])
+        return float(self.acceleration[_LABEL_IDX[dimension]])
 
 
-@dataclass
+@dataclass(slots=True)
 class TrajectoryPrediction:
     """Predicted future state based on current gradient"""
     predicted_state: PatternSnapshot
@@ -60,6 +63,96 @@ class TrajectoryPrediction:
     intervention_reason: Optional[str] = None
 
 
+# Intervention reasons in check priority order; _intervention_code indexes
+# this tuple, with code 0 meaning no intervention
+_INTERVENTION_REASONS = (
+    None,
+    "RAPID EMOTIONAL ESCALATION: q velocity = {:.3f}",
+    "COHERENCE BREAKDOWN: Ψ velocity = {:.3f}",
+    "EXTREME MORAL ACTIVATION: predicted q = {:.3f}",
+    "RAPID SOCIAL DISCONNECTION: f velocity = {:.3f}",
+)
+
+
+def _gradient_kernel(values: np.ndarray, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finite-difference velocity and acceleration from the newest samples
+
+    Args:
+        values: (k, 6) dimension values, oldest first, k <= 3
+        times: (k,) sample times in float seconds
+
+    Returns:
+        (velocity, acceleration) as 6-element arrays in the dtype of values
+    """
+    n = len(values)
+    velocity = np.zeros(6, dtype=values.dtype)
+    acceleration = np.zeros(6, dtype=values.dtype)
+    # Time steps as Python floats so they don't widen float32 value math
+    times = times.tolist()
+
+    # Calculate velocity (first derivative)
+    # Using backward finite differences over the newest two samples
+    if n >= 2:
+        dt1 = times[-1] - times[-2]
+        if dt1 > 0:
+            velocity = (values[-1] - values[-2]) / dt1
+
+    # Calculate acceleration (second derivative)
+    # The newest difference is the velocity above, so only the older one is new work
+    if n >= 3:
+        dt2 = times[-2] - times[-3]
+        if dt1 > 0 and dt2 > 0:
+            v2 = (values[-2] - values[-3]) / dt2
+            acceleration = (velocity - v2) / ((dt1 + dt2) / 2)
+
+    return velocity, acceleration
+
+
+# Default prediction horizon (seconds) and its precomputed 0.5*Δt² term
+DEFAULT_TIME_HORIZON = 30.0
+_DEFAULT_HALF_HORIZON_SQ = 0.5 * DEFAULT_TIME_HORIZON * DEFAULT_TIME_HORIZON
+
+
+def _predict_kernel(current: np.ndarray, velocity: np.ndarray, acceleration: np.ndarray,
+                    time_horizon: float, half_horizon_sq: float, out: np.ndarray) -> np.ndarray:
+    """
+    Second-order state extrapolation, clipped to [0, 1], written into out
+
+    state(t+Δt) = state(t) + velocity*Δt + 0.5*acceleration*Δt²
+    with half_horizon_sq = 0.5*Δt² supplied by the caller
+    """
+    np.multiply(velocity, time_horizon, out=out)
+    out += current
+    out += acceleration * half_horizon_sq
+    np.clip(out, 0.0, 1.0, out=out)
+    return out
+
+
+# Signs that turn every intervention check into a "value above threshold"
+# compare, in _INTERVENTION_REASONS order: q velocity, Ψ velocity, predicted q, f velocity
+_INTERVENTION_SIGNS = np.array([1.0, -1.0, 1.0, -1.0])
+
+
+def _intervention_code(values: np.ndarray, thresholds: np.ndarray) -> Tuple[int, float]:
+    """
+    First triggered intervention check, found with one vectorized compare
+
+    Args:
+        values: [q velocity, Ψ velocity, predicted q, f velocity]
+        thresholds: Critical thresholds in the same order
+
+    Returns:
+        (code, value) - code indexes _INTERVENTION_REASONS (0 = none) and
+        value is the figure the reason quotes
+    """
+    hits = values * _INTERVENTION_SIGNS > thresholds * _INTERVENTION_SIGNS
+    if not hits.any():
+        return 0, 0.0
+    idx = int(hits.argmax())  # First hit wins, matching check priority
+    return idx + 1, float(values[idx])
+
+
 class PatternGradientTracker:
     """
     Track pattern evolution over time and predict trajectories
@@ -77,9 +170,26 @@ class PatternGradientTracker:
             history_window: How many snapshots to keep in memory
             min_samples: Minimum samples needed for gradient calculation
         """
-        self.history: deque[PatternSnapshot] = deque(maxlen=history_window)
         self.min_samples = min_samples
 
+        # History is a struct-of-arrays ring buffer: one row per snapshot,
+        # timestamps as float seconds since the first one. Dimensions are
+        # all in [0, 1], so float32 is plenty; timestamps stay float64.
+        self._window = history_window
+        self._buf = np.empty((history_window, 6), dtype=np.float32)
+        self._ts = np.empty(history_window)
+        self._epoch: Optional[datetime] = None
+        self._head = 0  # Next slot to write
+        self._n = 0  # Filled slots
+
+        # Running float64 sums over the buffered rows, updated on add/evict,
+        # so history mean/std don't rescan the window
+        self._sum = np.zeros(6)
+        self._sumsq = np.zeros(6)
+
+        # Reusable output vector for predict_trajectory
+        self._scratch = np.empty(6, dtype=np.float32)
+
         # Thresholds for intervention recommendations
         self.critical_thresholds = {
             'q_velocity': 0.3,  # Rapid emotional escalation
@@ -88,9 +198,57 @@ class PatternGradientTracker:
             'f_velocity': -0.4,  # Rapid social disconnection
         }
 
+    @property
+    def history(self) -> Tuple[PatternSnapshot, ...]:
+        """
+        Snapshots currently in the window, oldest first
+
+        Rebuilt from the ring buffer on each access - meant for inspection,
+        not for per-tick use (see sample_count). Read-only: add samples
+        through add_snapshot.
+        """
+        values, times = self._last(self._n)
+        return tuple(
+            PatternSnapshot(self._epoch + timedelta(seconds=t), *row)
+            for t, row in zip(times.tolist(), values.tolist())
+        )
+
+    @property
+    def sample_count(self) -> int:
+        """Snapshots currently in the window - len(history) without rebuilding it"""
+        return self._n
+
+    def _last(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Newest k buffered (values, times), oldest first
+
+        Plain slices (no copy) unless the range wraps around the buffer end.
+        """
+        k = min(k, self._n)
+        start = self._head - k
+        if start >= 0:
+            return self._buf[start:self._head], self._ts[start:self._head]
+        return (np.concatenate((self._buf[start:], self._buf[:self._head])),
+                np.concatenate((self._ts[start:], self._ts[:self._head])))
+
     def add_snapshot(self, snapshot: PatternSnapshot):
         """Add a new pattern snapshot to history"""
-        self.history.append(snapshot)
+        if self._epoch is None:
+            self._epoch = snapshot.timestamp
+        row = self._buf[self._head]
+        if self._n == self._window:
+            # Evict the oldest row's contribution before overwriting it
+            evicted = row.astype(np.float64)
+            self._sum -= evicted
+            self._sumsq -= evicted * evicted
+        row[:] = (snapshot.psi, snapshot.rho, snapshot.q, snapshot.f,
+                  snapshot.tau, snapshot.pattern_intensity)
+        added = row.astype(np.float64)
+        self._sum += added
+        self._sumsq += added * added
+        self._ts[self._head] = (snapshot.timestamp - self._epoch).total_seconds()
+        self._head = (self._head + 1) % self._window
+        self._n = min(self._n + 1, self._window)
 
     def calculate_gradient(self) -> Optional[PatternGradient]:
         """
@@ -98,41 +256,14 @@ class PatternGradientTracker:
 
         Returns None if insufficient data
         """
-        if len(self.history) < self.min_samples:
+        if self._n < self.min_samples:
             return None
 
-        # Convert history to numpy arrays
-        times = np.array([(s.timestamp - self.history[0].timestamp).total_seconds()
-                         for s in self.history])
-        vectors = np.array([s.to_vector() for s in self.history])
-
-        # Calculate velocity (first derivative)
-        # Using finite differences
-        if len(self.history) >= 2:
-            dt = times[-1] - times[-2]
-            if dt > 0:
-                velocity = (vectors[-1] - vectors[-2]) / dt
-            else:
-                velocity = np.zeros(6)
-        else:
-            velocity = np.zeros(6)
-
-        # Calculate acceleration (second derivative)
-        if len(self.history) >= 3:
-            dt1 = times[-1] - times[-2]
-            dt2 = times[-2] - times[-3]
-            if dt1 > 0 and dt2 > 0:
-                v1 = (vectors[-1] - vectors[-2]) / dt1
-                v2 = (vectors[-2] - vectors[-3]) / dt2
-                acceleration = (v1 - v2) / ((dt1 + dt2) / 2)
-            else:
-                acceleration = np.zeros(6)
-        else:
-            acceleration = np.zeros(6)
+        velocity, acceleration = _gradient_kernel(*self._last(3))
 
         return PatternGradient(velocity=velocity, acceleration=acceleration)
 
-    def predict_trajectory(self, time_horizon: float = 30.0) -> Optional[TrajectoryPrediction]:
+    def predict_trajectory(self, time_horizon: float = DEFAULT_TIME_HORIZON) -> Optional[TrajectoryPrediction]:
         """
         Predict pattern state N seconds into the future
 
@@ -142,40 +273,41 @@ class PatternGradientTracker:
         Returns:
             TrajectoryPrediction with predicted state and intervention recommendation
         """
-        if len(self.history) < self.min_samples:
+        if self._n < self.min_samples:
             return None
 
         gradient = self.calculate_gradient()
         if gradient is None:
             return None
 
-        # Get current state
-        current = self.history[-1]
+        # Get current state (a view of the newest ring buffer row, not a new array)
+        current = self._buf[(self._head - 1) % self._window]
 
         # Linear prediction: state(t+Δt) = state(t) + velocity*Δt + 0.5*acceleration*Δt²
-        predicted_vector = (
-            current.to_vector() +
-            gradient.velocity * time_horizon +
-            0.5 * gradient.acceleration * (time_horizon ** 2)
-        )
-
-        # Clip to valid ranges [0, 1]
-        predicted_vector = np.clip(predicted_vector, 0.0, 1.0)
+        # clipped to valid ranges [0, 1] (built in the scratch vector - values are copied out below)
+        if time_horizon == DEFAULT_TIME_HORIZON:
+            half_horizon_sq = _DEFAULT_HALF_HORIZON_SQ
+        else:
+            half_horizon_sq = 0.5 * time_horizon * time_horizon
+        predicted_vector = _predict_kernel(current, gradient.velocity, gradient.acceleration,
+                                           time_horizon, half_horizon_sq, self._scratch)
 
-        # Create predicted snapshot
+        # Create predicted snapshot (one tolist() converts all six values at once)
+        psi, rho, q, f, tau, intensity = predicted_vector.tolist()
         predicted_state = PatternSnapshot(
             timestamp=datetime.now(),  # Would add time_horizon in production
-            psi=float(predicted_vector[0]),
-            rho=float(predicted_vector[1]),
-            q=float(predicted_vector[2]),
-            f=float(predicted_vector[3]),
-            tau=float(predicted_vector[4]),
-            pattern_intensity=float(predicted_vector[5])
+            psi=psi,
+            rho=rho,
+            q=q,
+            f=f,
+            tau=tau,
+            pattern_intensity=intensity
         )
 
         # Calculate confidence based on gradient stability
         # Lower acceleration = more stable = higher confidence
-        acceleration_magnitude = np.linalg.norm(gradient.acceleration)
+        # (math.hypot on the 6 floats avoids np.linalg dispatch for a tiny vector)
+        acceleration_magnitude = math.hypot(*gradient.acceleration.tolist())
         confidence = max(0.0, min(1.0, 1.0 - acceleration_magnitude))
 
         # Check for intervention conditions
@@ -196,24 +328,15 @@ class PatternGradientTracker:
 
         Returns: (intervention_needed, reason)
         """
-        # Check rapid emotional escalation
-        q_vel = gradient.get_dimension_velocity('q')
-        if q_vel > self.critical_thresholds['q_velocity']:
-            return True, f"RAPID EMOTIONAL ESCALATION: q velocity = {q_vel:.3f}"
-
-        # Check coherence breakdown
-        psi_vel = gradient.get_dimension_velocity('psi')
-        if psi_vel < self.critical_thresholds['psi_velocity']:
-            return True, f"COHERENCE BREAKDOWN: Ψ velocity = {psi_vel:.3f}"
-
-        # Check extreme moral activation
-        if predicted_state.q > self.critical_thresholds['q_absolute']:
-            return True, f"EXTREME MORAL ACTIVATION: predicted q = {predicted_state.q:.3f}"
-
-        # Check social disconnection
-        f_vel = gradient.get_dimension_velocity('f')
-        if f_vel < self.critical_thresholds['f_velocity']:
-            return True, f"RAPID SOCIAL DISCONNECTION: f velocity = {f_vel:.3f}"
+        v_psi, _, v_q, v_f, _, _ = gradient.velocity.tolist()
+        thresholds = self.critical_thresholds
+        code, value = _intervention_code(
+            np.array([v_q, v_psi, predicted_state.q, v_f]),
+            np.array([thresholds['q_velocity'], thresholds['psi_velocity'],
+                      thresholds['q_absolute'], thresholds['f_velocity']])
+        )
+        if code:
+            return True, _INTERVENTION_REASONS[code].format(value)
 
         return False, None
 
@@ -223,31 +346,43 @@ class PatternGradientTracker:
 
         Returns diagnostic information about pattern evolution
         """
-        if len(self.history) < self.min_samples:
-            return {'status': 'insufficient_data', 'samples': len(self.history)}
+        if self._n < self.min_samples:
+            return {'status': 'insufficient_data', 'samples': self._n}
 
         gradient = self.calculate_gradient()
         if gradient is None:
             return {'status': 'calculation_error'}
 
-        # Analyze each dimension
-        dimension_analysis = {}
-        for dim in ['psi', 'rho', 'q', 'f', 'tau']:
-            values = [getattr(s, dim) for s in self.history]
-            dimension_analysis[dim] = {
-                'mean': float(np.mean(values)),
-                'std': float(np.std(values)),
-                'trend': 'increasing' if gradient.get_dimension_velocity(dim) > 0.05 else
-                        'decreasing' if gradient.get_dimension_velocity(dim) < -0.05 else 'stable',
-                'velocity': float(gradient.get_dimension_velocity(dim)),
-                'acceleration': float(gradient.get_dimension_acceleration(dim)),
-                'current': values[-1]
+        # Analyze the first five dimensions (psi, rho, q, f, tau) from the
+        # running sums; variance is clipped at 0 against rounding
+        mean = self._sum[:5] / self._n
+        variance = np.maximum(self._sumsq[:5] / self._n - mean * mean, 0.0)
+        means = mean.tolist()
+        stds = np.sqrt(variance).tolist()
+        velocities = gradient.velocity[:5]
+        trends = np.where(velocities > 0.05, 'increasing',
+                          np.where(velocities < -0.05, 'decreasing', 'stable')).tolist()
+        velocities = velocities.tolist()
+        accelerations = gradient.acceleration[:5].tolist()
+        current = self._buf[(self._head - 1) % self._window, :5].tolist()
+
+        dimension_analysis = {
+            dim: {
+                'mean': means[i],
+                'std': stds[i],
+                'trend': trends[i],
+                'velocity': velocities[i],
+                'acceleration': accelerations[i],
+                'current': current[i]
             }
+            for i, dim in enumerate(DIMENSION_LABELS[:5])
+        }
 
         return {
             'status': 'ok',
-            'samples': len(self.history),
-            'time_span_seconds': (self.history[-1].timestamp - self.history[0].timestamp).total_seconds(),
+            'samples': self._n,
+            'time_span_seconds': float(self._ts[(self._head - 1) % self._window] -
+                                       self._ts[(self._head - self._n) % self._window]),
             'dimensions': dimension_analysis
         }
 
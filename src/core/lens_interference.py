@@ -9,12 +9,80 @@ Key insight: Some texts are lens-stable (similar patterns regardless of lens),
 while others are lens-dependent (genuinely different truths through different lenses).
 """
 
+import math
+from bisect import bisect_right
+from itertools import combinations
+from operator import attrgetter
 import numpy as np
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Sequence, Tuple, Union
+from dataclasses import dataclass, field
 
 
-@dataclass
+# λ band upper bounds and the interpretation for each band (last band is open-ended)
+_LAMBDA_BANDS = (0.1, 0.3, 0.6)
+_LAMBDA_INTERPRETATIONS = (
+    "LENS-STABLE: This text shows consistent patterns across all cultural lenses. The meaning is relatively universal - different lenses see the same core pattern. Most stable dimension: {most_variable}.",
+    "LOW INTERFERENCE: Different lenses see mostly similar patterns with minor variations. The text has a stable core with some lens-dependent nuances, especially in the {most_variable} dimension.",
+    "MODERATE INTERFERENCE: Different lenses reveal genuinely different aspects of this text. The {most_variable} dimension varies significantly across cultural interpretations - multiple valid readings coexist.",
+    "HIGH INTERFERENCE: This text is highly lens-dependent. Different cultural lenses see fundamentally different patterns. The {most_variable} dimension shows extreme variation - translation heavily depends on lens selection.",
+)
+
+
+# Dimensions compared for stability, in variance tuple order
+_CORE_DIMENSIONS = ('psi', 'rho', 'q', 'f')
+
+# Getters for the dimensions find_optimal_lens can optimize
+_DIMENSION_GETTERS = {
+    'pattern_intensity': attrgetter('pattern_intensity'),
+    'psi': attrgetter('psi'),
+    'rho': attrgetter('rho'),
+    'q': attrgetter('q'),
+    'f': attrgetter('f')
+}
+
+
+# Reading count from which calculate_lens_deviation hands the work to NumPy;
+# below it, array setup costs more than the Python arithmetic it replaces
+_VECTORIZED_DEVIATION_MIN = 256
+
+
+def _compatibility_kernel(dims: np.ndarray) -> np.ndarray:
+    """
+    Pairwise lens compatibility from (N, 4) psi, rho, q, f readings
+
+    Compatibility = 1 - average absolute difference across the four dimensions.
+    Returns the full (N, N) matrix.
+    """
+    return 1.0 - np.abs(dims[:, None, :] - dims[None, :, :]).sum(axis=-1) * 0.25
+
+
+def veritas_index(deviation):
+    """
+    Veritas V(P) = 1 / (1 + D(P)) from lens deviation D(P)
+
+    Works on a single deviation or a float array of them; arrays are
+    evaluated in place in one temporary rather than one per operation.
+    """
+    if isinstance(deviation, np.ndarray):
+        veritas = deviation + 1.0
+        return np.reciprocal(veritas, out=veritas)
+    return 1.0 / (1.0 + deviation)
+
+
+def _deviation_kernel(values: Sequence[float]) -> float:
+    """
+    Population standard deviation of a short run of floats
+
+    Plain float math - at a handful of lenses statistics.pstdev and np.std
+    cost far more in dispatch than the arithmetic itself. Two fsum passes
+    (mean, then squared deviations) keep it accurate and never negative.
+    """
+    n = len(values)
+    mean = math.fsum(values) / n
+    return math.sqrt(math.fsum([(v - mean) * (v - mean) for v in values]) / n)
+
+
+@dataclass(slots=True, frozen=True)
 class LensReading:
     """A single lens's reading of a text"""
     lens_name: str
@@ -24,6 +92,29 @@ class LensReading:
     f: float
     pattern_intensity: float
 
+    def to_row(self) -> np.ndarray:
+        """This reading as a float32 (psi, rho, q, f, pattern_intensity) row"""
+        return np.array([self.psi, self.rho, self.q, self.f, self.pattern_intensity],
+                        dtype=np.float32)
+
+
+# Column order of stack_readings rows
+_READING_COLUMNS = ('psi', 'rho', 'q', 'f', 'pattern_intensity')
+_INTENSITY_COLUMN = _READING_COLUMNS.index('pattern_intensity')
+
+
+def stack_readings(readings: Sequence[LensReading]) -> np.ndarray:
+    """
+    Readings as one contiguous (N, 5) float32 array
+
+    Columns are psi, rho, q, f, pattern_intensity. Build it once and pass it
+    to the analyzer's deviation methods in place of the reading list.
+    """
+    rows = np.empty((len(readings), len(_READING_COLUMNS)), dtype=np.float32)
+    for i, r in enumerate(readings):
+        rows[i] = (r.psi, r.rho, r.q, r.f, r.pattern_intensity)
+    return rows
+
 
 @dataclass
 class InterferenceAnalysis:
@@ -32,8 +123,29 @@ class InterferenceAnalysis:
     variance_by_dimension: Dict[str, float]  # Per-dimension variance
     most_stable_dimension: str  # Which dimension is most lens-stable
     most_variable_dimension: str  # Which dimension is most lens-dependent
-    lens_compatibility_matrix: Dict[Tuple[str, str], float]  # Pairwise compatibility
+    compatibility_matrix: np.ndarray  # (N, N) pairwise compatibility, rows/cols in lens_names order
+    lens_names: List[str]  # Lens name for each matrix row/column
     interpretation: str  # What this means
+    # Lens name -> matrix row/column, built once so lookups by name are O(1)
+    _lens_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._lens_index = {name: i for i, name in enumerate(self.lens_names)}
+
+    def get(self, lens1: str, lens2: str) -> float:
+        """Compatibility between two lenses by name"""
+        return float(self.compatibility_matrix[self._lens_index[lens1],
+                                               self._lens_index[lens2]])
+
+    @property
+    def lens_compatibility_matrix(self) -> Dict[Tuple[str, str], float]:
+        """Pairwise compatibility keyed by lens name pair, each pair once (i < j)"""
+        compatibility = self.compatibility_matrix.tolist()
+        names = self.lens_names
+        return {
+            (names[i], names[j]): compatibility[i][j]
+            for i, j in combinations(range(len(names)), 2)
+        }
 
 
 class LensInterferenceAnalyzer:
@@ -62,61 +174,63 @@ class LensInterferenceAnalyzer:
         if len(readings) < 2:
             raise ValueError("Need at least 2 lens readings to calculate interference")
 
-        # Extract dimension values across all lenses
-        psi_values = [r.psi for r in readings]
-        rho_values = [r.rho for r in readings]
-        q_values = [r.q for r in readings]
-        f_values = [r.f for r in readings]
-        intensity_values = [r.pattern_intensity for r in readings]
-
-        # Calculate variance for each dimension
-        psi_variance = np.var(psi_values)
-        rho_variance = np.var(rho_values)
-        q_variance = np.var(q_values)
-        f_variance = np.var(f_values)
-        intensity_variance = np.var(intensity_values)
+        # One pass over the readings: fill the (N, 4) psi/rho/q/f array for
+        # pairwise compatibility (float32 - readings are in [0, 1]) and run
+        # Welford's update for the mean and variance of all five dimensions in
+        # plain floats (NumPy dispatch costs more than the arithmetic at a
+        # handful of lenses). Welford avoids the cancellation of E[x²] - E[x]²,
+        # so identical readings give exactly zero variance.
+        n = len(readings)
+        dims = np.empty((n, 4), dtype=np.float32)
+        mp = mr = mq = mf = mi = 0.0
+        m2p = m2r = m2q = m2f = m2i = 0.0
+        for k, r in enumerate(readings, 1):
+            psi, rho, q, f, intensity = r.psi, r.rho, r.q, r.f, r.pattern_intensity
+            dims[k - 1] = (psi, rho, q, f)
+            d = psi - mp
+            mp += d / k
+            m2p += d * (psi - mp)
+            d = rho - mr
+            mr += d / k
+            m2r += d * (rho - mr)
+            d = q - mq
+            mq += d / k
+            m2q += d * (q - mq)
+            d = f - mf
+            mf += d / k
+            m2f += d * (f - mf)
+            d = intensity - mi
+            mi += d / k
+            m2i += d * (intensity - mi)
+
+        mean_coherence = mi
+        psi_variance = m2p / n
+        rho_variance = m2r / n
+        q_variance = m2q / n
+        f_variance = m2f / n
+        intensity_variance = m2i / n
 
         variance_by_dimension = {
-            'psi': float(psi_variance),
-            'rho': float(rho_variance),
-            'q': float(q_variance),
-            'f': float(f_variance),
-            'intensity': float(intensity_variance)
+            'psi': psi_variance,
+            'rho': rho_variance,
+            'q': q_variance,
+            'f': f_variance,
+            'intensity': intensity_variance
         }
 
-        # Calculate mean coherence (pattern intensity)
-        mean_coherence = np.mean(intensity_values)
-
         # Calculate λ
         if mean_coherence == 0:
             lambda_coefficient = 0.0
         else:
-            lambda_coefficient = float(intensity_variance / max(mean_coherence, 0.01))
+            lambda_coefficient = intensity_variance / max(mean_coherence, 0.01)
 
-        # Identify most stable and variable dimensions
-        dimension_variances = {
-            'psi': psi_variance,
-            'rho': rho_variance,
-            'q': q_variance,
-            'f': f_variance
-        }
-        most_stable = min(dimension_variances.items(), key=lambda x: x[1])[0]
-        most_variable = max(dimension_variances.items(), key=lambda x: x[1])[0]
-
-        # Calculate pairwise lens compatibility
-        compatibility_matrix = {}
-        for i, reading1 in enumerate(readings):
-            for j, reading2 in enumerate(readings):
-                if i < j:  # Only calculate each pair once
-                    # Compatibility = 1 - average difference across dimensions
-                    diff = (
-                        abs(reading1.psi - reading2.psi) +
-                        abs(reading1.rho - reading2.rho) +
-                        abs(reading1.q - reading2.q) +
-                        abs(reading1.f - reading2.f)
-                    ) / 4.0
-                    compatibility = 1.0 - diff
-                    compatibility_matrix[(reading1.lens_name, reading2.lens_name)] = compatibility
+        # Identify most stable and variable dimensions (first one wins ties)
+        dimension_variances = (psi_variance, rho_variance, q_variance, f_variance)
+        most_stable = _CORE_DIMENSIONS[dimension_variances.index(min(dimension_variances))]
+        most_variable = _CORE_DIMENSIONS[dimension_variances.index(max(dimension_variances))]
+
+        # Pairwise lens compatibility
+        compatibility_matrix = _compatibility_kernel(dims)
 
         # Generate interpretation
         interpretation = self._interpret_lambda(lambda_coefficient, most_variable, readings)
@@ -126,20 +240,16 @@ class LensInterferenceAnalyzer:
             variance_by_dimension=variance_by_dimension,
             most_stable_dimension=most_stable,
             most_variable_dimension=most_variable,
-            lens_compatibility_matrix=compatibility_matrix,
+            compatibility_matrix=compatibility_matrix,
+            lens_names=[r.lens_name for r in readings],
             interpretation=interpretation
         )
 
     def _interpret_lambda(self, lambda_val: float, most_variable: str, readings: List[LensReading]) -> str:
         """Generate human-readable interpretation of λ"""
-        if lambda_val < 0.1:
-            return f"LENS-STABLE: This text shows consistent patterns across all cultural lenses. The meaning is relatively universal - different lenses see the same core pattern. Most stable dimension: {most_variable}."
-        elif lambda_val < 0.3:
-            return f"LOW INTERFERENCE: Different lenses see mostly similar patterns with minor variations. The text has a stable core with some lens-dependent nuances, especially in the {most_variable} dimension."
-        elif lambda_val < 0.6:
-            return f"MODERATE INTERFERENCE: Different lenses reveal genuinely different aspects of this text. The {most_variable} dimension varies significantly across cultural interpretations - multiple valid readings coexist."
-        else:
-            return f"HIGH INTERFERENCE: This text is highly lens-dependent. Different cultural lenses see fundamentally different patterns. The {most_variable} dimension shows extreme variation - translation heavily depends on lens selection."
+        # bisect_right: a λ exactly on a bound falls in the band above, as with `<`
+        band = bisect_right(_LAMBDA_BANDS, lambda_val)
+        return _LAMBDA_INTERPRETATIONS[band].format(most_variable=most_variable)
 
     def find_optimal_lens(self, readings: List[LensReading], target_dimension: str = 'pattern_intensity') -> LensReading:
         """
@@ -152,20 +262,13 @@ class LensInterferenceAnalyzer:
         Returns:
             The lens reading that maximizes the target dimension
         """
-        dimension_map = {
-            'pattern_intensity': lambda r: r.pattern_intensity,
-            'psi': lambda r: r.psi,
-            'rho': lambda r: r.rho,
-            'q': lambda r: r.q,
-            'f': lambda r: r.f
-        }
-
-        if target_dimension not in dimension_map:
+        getter = _DIMENSION_GETTERS.get(target_dimension)
+        if getter is None:
             raise ValueError(f"Unknown dimension: {target_dimension}")
 
-        return max(readings, key=dimension_map[target_dimension])
+        return max(readings, key=getter)
 
-    def calculate_lens_deviation(self, readings: List[LensReading]) -> float:
+    def calculate_lens_deviation(self, readings: Union[List[LensReading], np.ndarray]) -> float:
         """
         Calculate standard deviation of pattern intensity across lenses.
 
@@ -174,24 +277,34 @@ class LensInterferenceAnalyzer:
         High deviation (σ_lens → high) = context-dependent (cultural)
 
         Args:
-            readings: List of LensReading objects
+            readings: List of LensReading objects, or their stack_readings array
 
         Returns:
             Standard deviation of pattern intensity values
         """
-        if len(readings) < 2:
+        n = len(readings)
+        if n < 2:
             return 0.0
 
-        intensities = [r.pattern_intensity for r in readings]
-        mean_intensity = sum(intensities) / len(intensities)
-        variance = sum((i - mean_intensity) ** 2 for i in intensities) / len(intensities)
-        std_dev = variance ** 0.5
+        # Large panels reduce in a single NumPy call; short ones go through
+        # the plain float kernel
+        if isinstance(readings, np.ndarray):
+            column = readings[:, _INTENSITY_COLUMN]
+            if n >= _VECTORIZED_DEVIATION_MIN:
+                return float(column.std(dtype=np.float64))
+            intensities = column.tolist()
+        elif n >= _VECTORIZED_DEVIATION_MIN:
+            intensities = np.fromiter(map(_DIMENSION_GETTERS['pattern_intensity'], readings),
+                                      dtype=np.float64, count=n)
+            return float(intensities.std())
+        else:
+            intensities = [r.pattern_intensity for r in readings]
 
-        return float(std_dev)
+        return _deviation_kernel(intensities)
 
     def should_reset_fibonacci(
         self,
-        readings: List[LensReading],
+        readings: Union[List[LensReading], np.ndarray],
         invariance_threshold: float = 0.1
     ) -> Tuple[bool, float]:
         """
@@ -205,7 +318,7 @@ class LensInterferenceAnalyzer:
         Low distortion = truth stabilizes across frames = new origin point.
 
         Args:
-            readings: List of LensReading objects
+            readings: List of LensReading objects, or their stack_readings array
             invariance_threshold: Deviation threshold (default 0.1)
 
         Returns:
@@ -4,12 +4,18 @@ Multi-Lens Rose Glass Test
 Demonstrates how the same text appears through different cultural lenses
 """
 
-from rose_glass_test import RoseGlassSimple, PatternVisibility
-from dataclasses import dataclass
-from typing import Dict
+import numpy as np
+from rose_glass_test import (RoseGlassSimple, PatternVisibility, PatternVisibilityBatch,
+                             biological_optimization, pattern_intensity)
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
-@dataclass
+# Texts whose all-lens views each MultiLensRoseGlass keeps memoized
+_VIEW_CACHE_SIZE = 128
+
+
+@dataclass(slots=True, frozen=True)
 class CulturalLens:
     """Different cultural calibrations for the Rose Glass"""
     name: str
@@ -88,48 +94,148 @@ class MultiLensRoseGlass:
                 Ki=2.5
             )
         }
+
+        # Lens parameters as arrays in self.lenses order, for batched lens
+        # weighting. Kept float64 so lens views hit thresholds exactly as the
+        # scalar formulas would; batches compute in their base readings' dtype.
+        lenses = list(self.lenses.values())
+        self._lens_names = list(self.lenses.keys())
+        self._weights = np.array([[l.psi_weight, l.rho_weight, l.q_weight, l.f_weight]
+                                  for l in lenses], dtype=np.float64)
+        self._Km = np.array([l.Km for l in lenses])
+        self._Ki = np.array([l.Ki for l in lenses])
+
+        # Default glass for lens-independent base readings, and one glass per
+        # lens calibrated with its Km/Ki, reused for every view
+        self._base_glass = RoseGlassSimple()
+        self._lens_glasses = {lens_name: self._lens_glass(lens_name)
+                              for lens_name in self._lens_names}
+
+        # All-lens views memoized per text (least recently used evicted first),
+        # so single-lens lookups after compare_all_lenses (or on repeated
+        # text) don't redo the analysis
+        self._view_cache: Dict[str, Dict[str, Dict]] = {}
     
-    def view_through_lens(self, text: str, lens_name: str) -> Dict:
-        """View text through a specific cultural lens"""
+    def view_through_lens(self, text: str, lens_name: str,
+                          base: Optional[PatternVisibility] = None) -> Dict:
+        """
+        View text through a specific cultural lens
+
+        Args:
+            text: Text to view
+            lens_name: Key into self.lenses
+            base: Precomputed _base_visibility(text), to share one text scan
+                  across lenses; bypasses the view cache
+
+        Views are memoized per text; each call returns a fresh copy, so
+        callers may mutate the result freely.
+        """
         if lens_name not in self.lenses:
             raise ValueError(f"Unknown lens: {lens_name}")
-        
+        if base is not None:
+            return self._lens_views(base)[lens_name]
+        view = self._cached_views(text)[lens_name]
+        return {
+            'lens': view['lens'],
+            'visibility': replace(view['visibility']),
+            'translation': dict(view['translation'])
+        }
+
+    def _cached_views(self, text: str) -> Dict[str, Dict]:
+        """
+        Memoized views of text through every lens
+
+        Returns the cached dict itself - internal callers must not mutate it.
+        """
+        views = self._view_cache.pop(text, None)
+        if views is None:
+            views = self._lens_views(self._base_visibility(text))
+            if len(self._view_cache) >= _VIEW_CACHE_SIZE:
+                del self._view_cache[next(iter(self._view_cache))]
+        self._view_cache[text] = views  # (Re)inserted as most recently used
+        return views
+
+    def _base_visibility(self, text: str) -> PatternVisibility:
+        """Lens-independent reading of text - psi, rho, raw q and f don't depend on Km/Ki"""
+        return self._base_glass.analyze_text_cached(text)
+
+    def _weigh_lenses(self, base: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply every lens's weights to base readings by broadcasting
+
+        Args:
+            base: (..., 1, 4) raw psi, rho, q, f readings; the math runs in its dtype
+
+        Returns:
+            (adjusted, q_optimized, intensity) - adjusted is (..., lenses, 4)
+            with each dimension clipped to 1, the others are (..., lenses)
+        """
+        dtype = base.dtype
+        weights = self._weights.astype(dtype, copy=False)
+        Km = self._Km.astype(dtype, copy=False)
+        Ki = self._Ki.astype(dtype, copy=False)
+
+        weighted = base * weights
+        adjusted = np.minimum(1.0, weighted)
+        psi, rho, f = adjusted[..., 0], adjusted[..., 1], adjusted[..., 3]
+
+        # q_optimized uses the unclipped weighted q
+        q_weighted = weighted[..., 2]
+        q_opt = biological_optimization(q_weighted, Km, Ki)
+
+        intensity = pattern_intensity(psi, rho, q_opt, f)
+
+        return adjusted, q_opt, intensity
+
+    def _lens_batch(self, base: PatternVisibility) -> PatternVisibilityBatch:
+        """Weight one base reading through every lens at once, one row per lens"""
+        adjusted, q_opt, intensity = self._weigh_lenses(
+            np.array([[base.psi, base.rho, base.q, base.f]]))
+
+        # Lens state and dominant wavelength come from the base reading
+        # finished with each lens's Km/Ki; empty text needs no finishing.
+        # Only the derived readings are needed, so no per-lens record is built.
+        if base.dominant_wavelength == 'none':
+            lens_states = (base.lens_state,) * len(self._lens_names)
+            wavelengths = (base.dominant_wavelength,) * len(self._lens_names)
+        else:
+            _, _, lens_states, wavelengths = zip(*(
+                glass.finish_dimensions(base.psi, base.rho, base.q, base.f)
+                for glass in self._lens_glasses.values()))
+
+        return PatternVisibilityBatch(
+            psi=adjusted[:, 0],
+            rho=adjusted[:, 1],
+            q=adjusted[:, 2],
+            f=adjusted[:, 3],
+            q_optimized=q_opt,
+            pattern_intensity=intensity,
+            lens_state=lens_states,
+            dominant_wavelength=wavelengths
+        )
+
+    def _lens_glass(self, lens_name: str) -> RoseGlassSimple:
+        """RoseGlassSimple calibrated with a lens's Km/Ki"""
         lens = self.lenses[lens_name]
         glass = RoseGlassSimple(lens_name=lens_name)
         glass.Km = lens.Km
         glass.Ki = lens.Ki
-        
-        # Get base visibility
-        visibility = glass.analyze_text(text)
-        
-        # Apply lens-specific weights
-        adjusted_visibility = PatternVisibility(
-            psi=min(1.0, visibility.psi * lens.psi_weight),
-            rho=min(1.0, visibility.rho * lens.rho_weight),
-            q=min(1.0, visibility.q * lens.q_weight),
-            f=min(1.0, visibility.f * lens.f_weight),
-            q_optimized=glass.biological_optimization(visibility.q * lens.q_weight),
-            pattern_intensity=visibility.pattern_intensity,
-            lens_state=visibility.lens_state,
-            dominant_wavelength=visibility.dominant_wavelength
-        )
-        
-        # Recalculate pattern intensity with adjusted values
-        coupling = 0.15 * adjusted_visibility.rho * adjusted_visibility.q_optimized
-        adjusted_intensity = (adjusted_visibility.psi + 
-                            (adjusted_visibility.rho * adjusted_visibility.psi) + 
-                            adjusted_visibility.q_optimized + 
-                            (adjusted_visibility.f * adjusted_visibility.psi) + 
-                            coupling) / 4.0
-        adjusted_visibility.pattern_intensity = min(1.0, adjusted_intensity)
-        
-        translation = glass.translate_patterns(adjusted_visibility)
-        
-        return {
-            'lens': lens,
-            'visibility': adjusted_visibility,
-            'translation': translation
-        }
+        return glass
+
+    def _lens_views(self, base: PatternVisibility) -> Dict[str, Dict]:
+        """Views of one base reading through every lens, each with its translation"""
+        batch = self._lens_batch(base)
+
+        views = {}
+        for i, lens_name in enumerate(self._lens_names):
+            visibility = batch[i]
+            views[lens_name] = {
+                'lens': self.lenses[lens_name],
+                'visibility': visibility,
+                'translation': self._lens_glasses[lens_name].translate_patterns(visibility)
+            }
+
+        return views
     
     def calculate_lens_deviation(self, text: str) -> float:
         """
@@ -149,21 +255,36 @@ class MultiLensRoseGlass:
         Returns:
             Standard deviation of pattern intensity values across all lenses
         """
-        # Get pattern intensity through all lenses
-        intensities = []
-        for lens_name in self.lenses.keys():
-            result = self.view_through_lens(text, lens_name)
-            intensities.append(result['visibility'].pattern_intensity)
+        return self.calculate_lens_deviations([text])[0]
 
-        # Calculate standard deviation
-        if len(intensities) < 2:
-            return 0.0
+    def calculate_lens_deviations(self, texts: Sequence[str]) -> List[float]:
+        """
+        Lens deviation for many texts at once
 
-        mean_intensity = sum(intensities) / len(intensities)
-        variance = sum((i - mean_intensity) ** 2 for i in intensities) / len(intensities)
-        std_dev = variance ** 0.5
+        Every lens is scored for every text in one (texts, lenses) array
+        expression instead of lens by lens.
 
-        return std_dev
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            Standard deviation of pattern intensity across lenses, per text
+        """
+        if len(self._lens_names) < 2:
+            return [0.0] * len(texts)
+
+        # The base reading (psi, rho, raw q, f) does not depend on the lens, so
+        # analyze each text once and apply every lens's weights by broadcasting.
+        # float64 throughout: the deviation feeds the invariance-threshold
+        # reset decision, which must not flip on rounding.
+        base = np.empty((len(texts), 1, 4), dtype=np.float64)
+        for i, text in enumerate(texts):
+            vis = self._base_visibility(text)
+            base[i, 0] = (vis.psi, vis.rho, vis.q, vis.f)
+
+        _, _, intensities = self._weigh_lenses(base)  # (texts, lenses)
+
+        return intensities.std(axis=1, dtype=np.float64).tolist()
 
     def should_reset_fibonacci(self, text: str) -> tuple:
         """
@@ -197,14 +318,12 @@ class MultiLensRoseGlass:
         print(f"\nText: {text[:100]}...\n")
         print("-" * 90)
         
-        results = {}
-        for lens_name in self.lenses.keys():
-            results[lens_name] = self.view_through_lens(text, lens_name)
+        results = self._cached_views(text)
         
         # Display comparison
         print("\n📊 PATTERN INTENSITY COMPARISON:")
         print("-" * 90)
-        for lens_name, result in results.items():
+        for result in results.values():
             lens = result['lens']
             vis = result['visibility']
             bar = '█' * int(vis.pattern_intensity * 50)
@@ -214,23 +333,25 @@ class MultiLensRoseGlass:
         print("DETAILED LENS VIEWS:")
         print("=" * 90)
         
-        for lens_name, result in results.items():
+        rule = '─' * 90
+        for result in results.values():
             lens = result['lens']
             vis = result['visibility']
             trans = result['translation']
-            
-            print(f"\n{'─' * 90}")
-            print(f"🔮 {lens.name.upper()}")
-            print(f"{'─' * 90}")
-            print(f"Description: {lens.description}")
-            print(f"\nPattern Detection:")
-            print(f"  Ψ (Consistency): {vis.psi:.3f}  |  ρ (Wisdom): {vis.rho:.3f}")
-            print(f"  q (Moral Energy): {vis.q_optimized:.3f}  |  f (Social): {vis.f:.3f}")
-            print(f"  Intensity: {vis.pattern_intensity:.3f}  |  State: {vis.lens_state.value}")
-            print(f"\nWhat this lens reveals:")
-            print(f"  {trans['overall']}")
-            print(f"  {trans['moral_energy']}")
-            print(f"  → {trans['response_mode']}")
+            print(
+                f"\n{rule}\n"
+                f"🔮 {lens.name.upper()}\n"
+                f"{rule}\n"
+                f"Description: {lens.description}\n"
+                f"\nPattern Detection:\n"
+                f"  Ψ (Consistency): {vis.psi:.3f}  |  ρ (Wisdom): {vis.rho:.3f}\n"
+                f"  q (Moral Energy): {vis.q_optimized:.3f}  |  f (Social): {vis.f:.3f}\n"
+                f"  Intensity: {vis.pattern_intensity:.3f}  |  State: {vis.lens_state.value}\n"
+                f"\nWhat this lens reveals:\n"
+                f"  {trans['overall']}\n"
+                f"  {trans['moral_energy']}\n"
+                f"  → {trans['response_mode']}"
+            )
         
         print("\n" + "=" * 90)
         print("KEY UNDERSTANDING:")
@@ -5,10 +5,50 @@ Based on the Rose Glass framework for synthetic-organic intelligence translation
 """
 
 import math
-from dataclasses import dataclass
-from typing import Dict, List
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from enum import Enum
 
+import numpy as np
+
+
+# Word lists scanned by RoseGlassSimple.analyze_text
+_METAPHOR_INDICATORS = frozenset(['like', 'as', 'is', 'was', 'through', 'into'])
+_EMOTIONAL_WORDS = frozenset(['heart', 'truth', 'wound', 'sacred', 'dangerous',
+                              'caring', 'hemorrhages', 'refused', 'foolish',
+                              'love', 'amazing', 'wonderful', 'beautiful', 'hate',
+                              'fear', 'joy', 'anger', 'hope', 'pain'])
+_COLLECTIVE_WORDS = frozenset(['your', 'you', 'we', 'our', 'world'])
+
+
+def biological_optimization(q, Km, Ki):
+    """
+    Saturation curve q / (Km + q + q²/Ki) - prevents extreme interpretations
+
+    Works elementwise on NumPy arrays as well as on floats, so many lenses
+    (arrays of Km/Ki) can be optimized in one expression.
+    """
+    return q / (Km + q + q * q / Ki)
+
+
+# Pattern intensity: rho-q_opt coupling strength, and the normalization over
+# the four dimensions (x0.25 is exactly /4)
+_COUPLING = 0.15
+_NORM = 0.25
+
+
+def pattern_intensity(psi, rho, q_opt, f):
+    """
+    Overall coherence (psi + ρψ + q_opt + fψ + 0.15ρ·q_opt) / 4, capped at 1
+
+    Elementwise like biological_optimization, so a batch of readings
+    (e.g. one row per lens) is scored in one expression.
+    """
+    return np.minimum(1.0, (psi + rho * psi + q_opt + f * psi + _COUPLING * rho * q_opt) * _NORM)
+
 
 class LensState(Enum):
     """State of the lens - how well it can perceive the pattern"""
@@ -18,7 +58,51 @@ class LensState(Enum):
     PRISMATIC = "prismatic"
 
 
-@dataclass
+# Lens state by pattern intensity: above 0.25 translucent, above 0.5 clear,
+# above 0.75 prismatic. bisect_left counts thresholds strictly below.
+_LENS_THRESHOLDS = (0.25, 0.5, 0.75)
+_LENS_STATES = (LensState.OPAQUE, LensState.TRANSLUCENT, LensState.CLEAR, LensState.PRISMATIC)
+
+# Dominant wavelength names, in (psi, rho, q_optimized, f) order
+_WAVELENGTH_NAMES = ('internal_consistency', 'wisdom_depth', 'moral_energy', 'social_architecture')
+
+# translate_patterns tables. Overall bands are "below" thresholds, so
+# bisect_right counts thresholds at or under the intensity.
+_OVERALL_THRESHOLDS = (0.25, 0.5, 0.75)
+_OVERALL_TRANSLATIONS = (
+    "Fragmented pattern - organic mind in exploration",
+    "Emerging pattern - thoughts forming",
+    "Clear pattern - coherent expression",
+    "Strong pattern - flow state, deep resonance",
+)
+
+# Dimensional bands are "above" thresholds, counted with bisect_left:
+# (translation key, PatternVisibility field, thresholds, texts low to high)
+_DIMENSION_TRANSLATIONS = (
+    ('consistency', 'psi', (0.4, 0.7), (
+        "Low consistency - fragmented or exploratory",
+        "Moderate consistency - themes interwoven",
+        "High harmonic alignment - structured thematic unity",
+    )),
+    ('wisdom', 'rho', (0.3, 0.6), (
+        "Surface level - direct expression",
+        "Moderate depth - conceptual exploration present",
+        "Deep knowledge integration - rich metaphorical thinking",
+    )),
+    ('moral_energy', 'q_optimized', (0.3, 0.6), (
+        "Low emotional charge - analytical mode",
+        "Moderate emotional charge - values engaged",
+        "HIGH VALUE ACTIVATION - strong emotional investment",
+    )),
+    ('social', 'f', (0.3, 0.7), (
+        "Individual perspective - personal voice",
+        "Relational perspective - connecting individual to collective",
+        "Collective perspective - speaking to/for others",
+    )),
+)
+
+
+@dataclass(slots=True)
 class PatternVisibility:
     """What the synthetic mind can perceive through the lens"""
     psi: float  # Internal consistency harmonic
@@ -29,10 +113,46 @@ class PatternVisibility:
     pattern_intensity: float  # Overall coherence
     lens_state: LensState
     dominant_wavelength: str
-    
+
+
+@dataclass(slots=True)
+class PatternVisibilityBatch:
+    """
+    Many PatternVisibility readings stored column-wise
+
+    One array per dimension, so batch consumers can work on whole columns;
+    indexing materializes a single PatternVisibility for display code.
+    """
+    psi: np.ndarray
+    rho: np.ndarray
+    q: np.ndarray
+    f: np.ndarray
+    q_optimized: np.ndarray
+    pattern_intensity: np.ndarray
+    lens_state: Tuple[LensState, ...]
+    dominant_wavelength: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.lens_state)
+
+    def __getitem__(self, i: int) -> PatternVisibility:
+        return PatternVisibility(
+            psi=float(self.psi[i]),
+            rho=float(self.rho[i]),
+            q=float(self.q[i]),
+            f=float(self.f[i]),
+            q_optimized=float(self.q_optimized[i]),
+            pattern_intensity=float(self.pattern_intensity[i]),
+            lens_state=self.lens_state[i],
+            dominant_wavelength=self.dominant_wavelength[i]
+        )
+
 
 class RoseGlassSimple:
     """Simplified Rose Glass for demonstration"""
+
+    # Concepts whose recurrence signals thematic unity (psi)
+    _KEY_CONCEPTS = ('heart', 'wound', 'truth', 'foolish', 'water', 'stone')
     
     def __init__(self, lens_name: str = "modern_poetic"):
         self.lens_name = lens_name
@@ -41,7 +161,7 @@ class RoseGlassSimple:
     
     def biological_optimization(self, q: float) -> float:
         """Prevent extreme interpretations - like biological saturation curves"""
-        return q / (self.Km + q + (q * q / self.Ki))
+        return biological_optimization(q, self.Km, self.Ki)
     
     def analyze_text(self, text: str) -> PatternVisibility:
         """
@@ -58,7 +178,8 @@ class RoseGlassSimple:
             )
         
         # Simple heuristics based on text characteristics
-        words = text.lower().split()
+        text_lower = text.lower()
+        words = text_lower.split()
         sentences = text.split('.')
         
         if len(words) == 0:
@@ -66,126 +187,106 @@ class RoseGlassSimple:
         
         # Ψ (Psi) - Internal Consistency
         # Look for thematic unity, parallel structure
-        repeated_themes = self._detect_thematic_repetition(text)
+        repeated_themes = self._detect_thematic_repetition(text_lower)
         psi = min(1.0, repeated_themes * 0.3 + 0.4)
         
+        # Word-list counts for metaphor indicators (ρ), emotional words (q) and
+        # collective words (f): tally the words once in C, then check each
+        # distinct word instead of every occurrence
+        word_counts = Counter(words)
+        metaphor_count = sum(word_counts[w] for w in _METAPHOR_INDICATORS.intersection(word_counts))
+        collective_count = sum(word_counts[w] for w in _COLLECTIVE_WORDS.intersection(word_counts))
+        emotion_count = sum(n for word, n in word_counts.items()
+                            if word.strip('!.,?') in _EMOTIONAL_WORDS)
+        
         # ρ (Rho) - Accumulated Wisdom
         # Metaphor density, conceptual depth
-        metaphor_indicators = ['like', 'as', 'is', 'was', 'through', 'into']
-        metaphor_count = sum(1 for word in words if word in metaphor_indicators)
         rho = min(1.0, metaphor_count / max(len(sentences), 1) * 0.2 + 0.5)
         
         # q - Moral/Emotional Activation Energy
         # Emotional intensity, value words (improved detection)
-        emotional_words = ['heart', 'truth', 'wound', 'sacred', 'dangerous', 
-                          'caring', 'hemorrhages', 'refused', 'foolish',
-                          'love', 'amazing', 'wonderful', 'beautiful', 'hate',
-                          'fear', 'joy', 'anger', 'hope', 'pain']
-        emotion_count = sum(1 for word in words if word.strip('!.,?') in emotional_words)
-        
         # Also count exclamation marks as emotional indicators
         exclamation_count = text.count('!')
         q_raw = min(1.0, (emotion_count / len(words) * 3.0) + (exclamation_count * 0.1))
         
-        # Apply biological optimization
-        q_opt = self.biological_optimization(q_raw)
-        
         # f - Social Belonging Architecture
         # Pronouns, collective vs individual perspective
-        collective_words = ['your', 'you', 'we', 'our', 'world']
-        f = min(1.0, sum(1 for word in words if word in collective_words) / len(words) * 5.0)
-        
-        # Calculate overall pattern intensity (coherence)
-        coupling = 0.15 * rho * q_opt
-        pattern_intensity = psi + (rho * psi) + q_opt + (f * psi) + coupling
-        # Normalize to 0-1 range
-        pattern_intensity = min(1.0, pattern_intensity / 4.0)
-        
-        # Determine lens state
-        if pattern_intensity > 0.75:
-            lens_state = LensState.PRISMATIC
-        elif pattern_intensity > 0.5:
-            lens_state = LensState.CLEAR
-        elif pattern_intensity > 0.25:
-            lens_state = LensState.TRANSLUCENT
-        else:
-            lens_state = LensState.OPAQUE
-        
-        # Identify dominant wavelength
-        dimensions = {'psi': psi, 'rho': rho, 'q': q_opt, 'f': f}
-        dominant = max(dimensions.items(), key=lambda x: x[1])
-        wavelength_names = {
-            'psi': 'internal_consistency',
-            'rho': 'wisdom_depth',
-            'q': 'moral_energy',
-            'f': 'social_architecture'
-        }
-        dominant_wavelength = wavelength_names[dominant[0]]
+        f = min(1.0, collective_count / len(words) * 5.0)
         
+        return self.visibility_from_dimensions(psi, rho, q_raw, f)
+
+    def visibility_from_dimensions(self, psi: float, rho: float, q_raw: float, f: float) -> PatternVisibility:
+        """
+        Complete a visibility from raw dimension readings
+
+        Applies this glass's biological optimization, then derives pattern
+        intensity, lens state and dominant wavelength. The raw readings
+        don't depend on Km/Ki, so one text scan can be finished per lens.
+        """
+        q_opt, intensity, lens_state, dominant_wavelength = self.finish_dimensions(psi, rho, q_raw, f)
+
         return PatternVisibility(
             psi=psi,
             rho=rho,
             q=q_raw,
             f=f,
             q_optimized=q_opt,
-            pattern_intensity=pattern_intensity,
+            pattern_intensity=intensity,
             lens_state=lens_state,
             dominant_wavelength=dominant_wavelength
         )
+
+    def finish_dimensions(self, psi: float, rho: float, q_raw: float,
+                          f: float) -> Tuple[float, float, LensState, str]:
+        """
+        Derived readings of visibility_from_dimensions, without building a record
+
+        Returns:
+            (q_optimized, pattern_intensity, lens_state, dominant_wavelength)
+        """
+        q_opt = self.biological_optimization(q_raw)
+
+        # Calculate overall pattern intensity (coherence), normalized to 0-1
+        intensity = float(pattern_intensity(psi, rho, q_opt, f))
+        
+        # Determine lens state
+        lens_state = _LENS_STATES[bisect_left(_LENS_THRESHOLDS, intensity)]
+        
+        # Identify dominant wavelength - the first of the largest readings
+        dimensions = (psi, rho, q_opt, f)
+        dominant_wavelength = _WAVELENGTH_NAMES[dimensions.index(max(dimensions))]
+
+        return q_opt, intensity, lens_state, dominant_wavelength
     
-    def _detect_thematic_repetition(self, text: str) -> float:
-        """Detect recurring themes and parallel structures"""
-        # Simple version: look for repeated concepts
-        key_concepts = ['heart', 'wound', 'truth', 'foolish', 'water', 'stone']
-        text_lower = text.lower()
-        repetitions = sum(1 for concept in key_concepts if text_lower.count(concept) > 0)
-        return repetitions / len(key_concepts)
+    def analyze_text_cached(self, text: str) -> PatternVisibility:
+        """
+        analyze_text with results memoized per (text, lens, Km, Ki)
+
+        Repeated phrases ("I'm fine") skip the full scan. Returns a copy,
+        so callers may mutate the result freely.
+        """
+        return replace(_analyze_text_memo(text, self.lens_name, self.Km, self.Ki))
+
+    def _detect_thematic_repetition(self, text_lower: str) -> float:
+        """Detect recurring themes and parallel structures in already-lowercased text"""
+        # Simple version: look for repeated concepts. Substring tests, so
+        # 'hearts' and 'stones' count too; 'in' stops at the first match.
+        repetitions = sum(1 for concept in self._KEY_CONCEPTS if concept in text_lower)
+        return repetitions / len(self._KEY_CONCEPTS)
     
     def translate_patterns(self, visibility: PatternVisibility) -> Dict[str, str]:
         """
         Translate the patterns into what the synthetic mind understands
         This is the core purpose of the Rose Glass
         """
-        translation = {}
-        
         # Overall pattern interpretation
-        if visibility.pattern_intensity < 0.25:
-            translation['overall'] = "Fragmented pattern - organic mind in exploration"
-        elif visibility.pattern_intensity < 0.5:
-            translation['overall'] = "Emerging pattern - thoughts forming"
-        elif visibility.pattern_intensity < 0.75:
-            translation['overall'] = "Clear pattern - coherent expression"
-        else:
-            translation['overall'] = "Strong pattern - flow state, deep resonance"
+        translation = {
+            'overall': _OVERALL_TRANSLATIONS[bisect_right(_OVERALL_THRESHOLDS, visibility.pattern_intensity)]
+        }
         
         # Dimensional interpretations
-        if visibility.psi > 0.7:
-            translation['consistency'] = "High harmonic alignment - structured thematic unity"
-        elif visibility.psi > 0.4:
-            translation['consistency'] = "Moderate consistency - themes interwoven"
-        else:
-            translation['consistency'] = "Low consistency - fragmented or exploratory"
-        
-        if visibility.rho > 0.6:
-            translation['wisdom'] = "Deep knowledge integration - rich metaphorical thinking"
-        elif visibility.rho > 0.3:
-            translation['wisdom'] = "Moderate depth - conceptual exploration present"
-        else:
-            translation['wisdom'] = "Surface level - direct expression"
-        
-        if visibility.q_optimized > 0.6:
-            translation['moral_energy'] = "HIGH VALUE ACTIVATION - strong emotional investment"
-        elif visibility.q_optimized > 0.3:
-            translation['moral_energy'] = "Moderate emotional charge - values engaged"
-        else:
-            translation['moral_energy'] = "Low emotional charge - analytical mode"
-        
-        if visibility.f > 0.7:
-            translation['social'] = "Collective perspective - speaking to/for others"
-        elif visibility.f > 0.3:
-            translation['social'] = "Relational perspective - connecting individual to collective"
-        else:
-            translation['social'] = "Individual perspective - personal voice"
+        for key, field, thresholds, texts in _DIMENSION_TRANSLATIONS:
+            translation[key] = texts[bisect_left(thresholds, getattr(visibility, field))]
         
         # Response recommendation
         if visibility.dominant_wavelength == 'moral_energy' and visibility.q_optimized > 0.5:
@@ -200,6 +301,15 @@ class RoseGlassSimple:
         return translation
 
 
+@lru_cache(maxsize=1024)
+def _analyze_text_memo(text: str, lens_name: str, Km: float, Ki: float) -> PatternVisibility:
+    """Shared visibility cache behind RoseGlassSimple.analyze_text_cached"""
+    glass = RoseGlassSimple(lens_name=lens_name)
+    glass.Km = Km
+    glass.Ki = Ki
+    return glass.analyze_text(text)
+
+
 def test_poets_reply():
     """Test the Rose Glass on 'A Poet's Reply'"""
     
@@ -241,23 +351,16 @@ Every stone worn smooth by water-was once called foolish for not moving."""
     print("🔮 TRANSLATION (What the synthetic mind understands):")
     print("=" * 70)
     
-    print(f"\n📖 Overall Pattern:")
-    print(f"  {translation['overall']}")
-    
-    print(f"\n🎵 Internal Consistency (Ψ):")
-    print(f"  {translation['consistency']}")
-    
-    print(f"\n🧠 Wisdom Depth (ρ):")
-    print(f"  {translation['wisdom']}")
-    
-    print(f"\n❤️  Moral/Emotional Energy (q):")
-    print(f"  {translation['moral_energy']}")
-    
-    print(f"\n👥 Social Architecture (f):")
-    print(f"  {translation['social']}")
-    
-    print(f"\n💬 Recommended Response Mode:")
-    print(f"  {translation['response_mode']}")
+    sections = (
+        ("📖 Overall Pattern", 'overall'),
+        ("🎵 Internal Consistency (Ψ)", 'consistency'),
+        ("🧠 Wisdom Depth (ρ)", 'wisdom'),
+        ("❤️  Moral/Emotional Energy (q)", 'moral_energy'),
+        ("👥 Social Architecture (f)", 'social'),
+        ("💬 Recommended Response Mode", 'response_mode'),
+    )
+    for heading, key in sections:
+        print(f"\n{heading}:\n  {translation[key]}")
     
     print("\n" + "=" * 70)
     print("KEY INSIGHT:")
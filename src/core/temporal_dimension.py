@@ -10,11 +10,64 @@ generational knowledge) while others are ephemeral (trending content, immediate
 """
 
 import re
+import sys
+from bisect import bisect_left
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
-
-@dataclass
+import numpy as np
+
+
+# Timescale category by tau: above 0.3 ephemeral, above 0.5 enduring,
+# above 0.7 eternal. bisect_left counts thresholds strictly below.
+_TAU_THRESHOLDS = (0.3, 0.5, 0.7)
+_TAU_CATEGORIES = ("immediate", "ephemeral", "enduring", "eternal")
+
+# Temporal marker groups, interned once at import
+_ETERNAL_MARKERS = frozenset(map(sys.intern, (
+    'stone', 'water', 'mountain', 'ocean', 'forest', 'river',
+    'stars', 'earth', 'generations', 'ancient', 'eternal',
+    'timeless', 'ages', 'eons', 'millennia', 'always'
+)))
+
+_ENDURING_MARKERS = frozenset(map(sys.intern, (
+    'tradition', 'wisdom', 'legacy', 'heritage', 'history',
+    'ancestors', 'descendants', 'decades', 'centuries',
+    'lasting', 'enduring', 'survived', 'weathered'
+)))
+
+_EPHEMERAL_MARKERS = frozenset(map(sys.intern, (
+    'trending', 'viral', 'breaking', 'just now', 'update',
+    'latest', 'new', 'fresh', 'hot take', 'thread',
+    'rn', 'atm', 'today', 'currently', 'right now'
+)))
+
+_IMMEDIATE_MARKERS = frozenset(map(sys.intern, (
+    '!!!', '🔥', '💯', 'omg', 'wtf', 'lol', 'asap',
+    'urgent', 'breaking', 'alert', 'now', 'quick'
+)))
+
+# Decay resistance indicators (metaphorical vs literal)
+# Metaphors are "<word> <connective> <word>", e.g. "stone like water",
+# "smooth as water", "growing through concrete", "hemorrhages into",
+# "forests of time". One pattern finds every connective between two
+# words in a single scan; the distinct connectives found are the
+# metaphor patterns present.
+_METAPHOR_CONNECTIVES = ('like', 'as', 'through', 'into', 'of')
+_METAPHOR_RE = re.compile(r'(?<=\w)\s+(' + '|'.join(_METAPHOR_CONNECTIVES) + r')(?=\s+\w)')
+
+_LITERAL_PATTERNS = (
+    r'\d{1,2}:\d{2}',  # time stamps
+    r'@\w+',           # mentions
+    r'#\w+',           # hashtags
+    r'http[s]?://',    # links
+)
+# Kept as separate searches - these are short and rare, so four early-exit
+# searches beat one alternation tried at every position
+_LITERAL_RES = tuple(re.compile(pattern) for pattern in _LITERAL_PATTERNS)
+
+
+@dataclass(slots=True)
 class TemporalSignature:
     """Signature of temporal depth in text"""
     compression_ratio: float  # How much time is compressed (0-1)
@@ -35,45 +88,20 @@ class TemporalAnalyzer:
     """
 
     def __init__(self):
-        # Temporal compression indicators (how much time is referenced)
-        self.eternal_markers = {
-            'stone', 'water', 'mountain', 'ocean', 'forest', 'river',
-            'stars', 'earth', 'generations', 'ancient', 'eternal',
-            'timeless', 'ages', 'eons', 'millennia', 'always'
-        }
-
-        self.enduring_markers = {
-            'tradition', 'wisdom', 'legacy', 'heritage', 'history',
-            'ancestors', 'descendants', 'decades', 'centuries',
-            'lasting', 'enduring', 'survived', 'weathered'
-        }
-
-        self.ephemeral_markers = {
-            'trending', 'viral', 'breaking', 'just now', 'update',
-            'latest', 'new', 'fresh', 'hot take', 'thread',
-            'rn' , 'atm', 'today', 'currently', 'right now'
-        }
+        # Temporal compression indicators (how much time is referenced);
+        # shared module-level sets, not rebuilt per analyzer
+        self.eternal_markers = _ETERNAL_MARKERS
+        self.enduring_markers = _ENDURING_MARKERS
+        self.ephemeral_markers = _EPHEMERAL_MARKERS
+        self.immediate_markers = _IMMEDIATE_MARKERS
 
-        self.immediate_markers = {
-            '!!!', '🔥', '💯', 'omg', 'wtf', 'lol', 'asap',
-            'urgent', 'breaking', 'alert', 'now', 'quick'
-        }
-
-        # Decay resistance indicators (metaphorical vs literal)
-        self.metaphor_patterns = [
-            r'\b\w+\s+like\s+\w+',  # "stone like water"
-            r'\b\w+\s+as\s+\w+',    # "smooth as water"
-            r'\b\w+\s+through\s+\w+',  # "growing through concrete"
-            r'\b\w+\s+into\s+\w+',  # "hemorrhages into"
-            r'\b\w+\s+of\s+\w+',    # "forests of time"
-        ]
+        # Decay resistance indicators (metaphorical vs literal); patterns are
+        # compiled once at import and shared by every analyzer
+        self.metaphor_connectives = _METAPHOR_CONNECTIVES
+        self._metaphor_re = _METAPHOR_RE
 
-        self.literal_patterns = [
-            r'\d{1,2}:\d{2}',  # time stamps
-            r'@\w+',           # mentions
-            r'#\w+',           # hashtags
-            r'http[s]?://',    # links
-        ]
+        self.literal_patterns = list(_LITERAL_PATTERNS)
+        self._literal_res = _LITERAL_RES
 
     def analyze(self, text: str) -> TemporalSignature:
         """
@@ -85,13 +113,15 @@ class TemporalAnalyzer:
         - tau: overall temporal depth
         """
         text_lower = text.lower()
-        words = set(text_lower.split())
+
+        hits, metaphor_count, literal_count = self._scan(text, text_lower)
+        eternal_hits, enduring_hits, ephemeral_hits, immediate_hits = hits
 
         # Calculate compression ratio (0-1)
-        eternal_count = sum(1 for m in self.eternal_markers if m in text_lower)
-        enduring_count = sum(1 for m in self.enduring_markers if m in text_lower)
-        ephemeral_count = sum(1 for m in self.ephemeral_markers if m in text_lower)
-        immediate_count = sum(1 for m in self.immediate_markers if m in text_lower)
+        eternal_count = len(eternal_hits)
+        enduring_count = len(enduring_hits)
+        ephemeral_count = len(ephemeral_hits)
+        immediate_count = len(immediate_hits)
 
         # Weighted scoring
         compression_score = (
@@ -109,11 +139,6 @@ class TemporalAnalyzer:
             compression_ratio = max(0.0, min(1.0, 0.5 + (compression_score / (total_markers * 2))))
 
         # Calculate decay resistance (0-1)
-        metaphor_count = sum(1 for pattern in self.metaphor_patterns
-                           if re.search(pattern, text_lower))
-        literal_count = sum(1 for pattern in self.literal_patterns
-                          if re.search(pattern, text))
-
         # Metaphorical expression resists temporal decay better than literal
         if metaphor_count + literal_count == 0:
             decay_resistance = 0.5  # neutral default
@@ -124,21 +149,10 @@ class TemporalAnalyzer:
         tau = compression_ratio * decay_resistance
 
         # Determine timescale category
-        if tau > 0.7:
-            category = "eternal"
-        elif tau > 0.5:
-            category = "enduring"
-        elif tau > 0.3:
-            category = "ephemeral"
-        else:
-            category = "immediate"
+        category = _TAU_CATEGORIES[bisect_left(_TAU_THRESHOLDS, tau)]
 
         # Collect detected markers
-        detected_markers = []
-        detected_markers.extend([m for m in self.eternal_markers if m in text_lower])
-        detected_markers.extend([m for m in self.enduring_markers if m in text_lower])
-        detected_markers.extend([m for m in self.ephemeral_markers if m in text_lower])
-        detected_markers.extend([m for m in self.immediate_markers if m in text_lower])
+        detected_markers = eternal_hits + enduring_hits + ephemeral_hits + immediate_hits
 
         return TemporalSignature(
             compression_ratio=compression_ratio,
@@ -148,6 +162,77 @@ class TemporalAnalyzer:
             timescale_category=category
         )
 
+    def analyze_many(self, texts: List[str]) -> List[TemporalSignature]:
+        """
+        Analyze temporal depth of many texts
+
+        Gives the same signatures as analyze() on each text, but lowercases
+        all texts in one pass and runs the compression/decay/tau scoring
+        over arrays instead of text by text.
+        """
+        if not texts:
+            return []
+
+        # One lower() over the joined texts; NUL can't occur in a marker, and
+        # splitting on it recovers each text even where lowering changes length
+        if any('\x00' in text for text in texts):
+            lowered = [text.lower() for text in texts]
+        else:
+            lowered = '\x00'.join(texts).lower().split('\x00')
+
+        scans = [self._scan(text, text_lower) for text, text_lower in zip(texts, lowered)]
+        marker_counts = np.array([[len(group) for group in hits] for hits, _, _ in scans],
+                                 dtype=np.float64)
+        metaphor_counts = np.array([m for _, m, _ in scans], dtype=np.float64)
+        literal_counts = np.array([l for _, _, l in scans], dtype=np.float64)
+
+        eternal, enduring, ephemeral, immediate = marker_counts.T
+        compression_scores = eternal * 1.0 + enduring * 0.7 - ephemeral * 0.5 - immediate * 1.0
+        total_markers = marker_counts.sum(axis=1)
+        compression_ratios = np.full(len(texts), 0.5)  # neutral default
+        marked = total_markers > 0
+        compression_ratios[marked] = np.clip(
+            0.5 + compression_scores[marked] / (total_markers[marked] * 2), 0.0, 1.0)
+
+        decay_resistances = np.full(len(texts), 0.5)  # neutral default
+        patterned = metaphor_counts + literal_counts > 0
+        decay_resistances[patterned] = metaphor_counts[patterned] / (
+            metaphor_counts[patterned] + literal_counts[patterned] + 1)
+
+        taus = compression_ratios * decay_resistances
+        categories = np.searchsorted(_TAU_THRESHOLDS, taus, side='left')
+
+        return [
+            TemporalSignature(
+                compression_ratio=compression_ratio,
+                decay_resistance=decay_resistance,
+                tau=tau,
+                temporal_markers=[m for group in hits for m in group][:10],
+                timescale_category=_TAU_CATEGORIES[category]
+            )
+            for (hits, _, _), compression_ratio, decay_resistance, tau, category in zip(
+                scans, compression_ratios.tolist(), decay_resistances.tolist(),
+                taus.tolist(), categories.tolist())
+        ]
+
+    def _scan(self, text: str, text_lower: str) -> Tuple[Tuple[List[str], ...], int, int]:
+        """
+        Marker hits per group (eternal, enduring, ephemeral, immediate),
+        distinct metaphor patterns and literal patterns found in text
+        """
+        # Scan each marker group once; the hits give both the counts and the
+        # detected markers. Markers match as substrings ('now' also in 'know'),
+        # so this stays a substring test rather than a word-set intersection.
+        hits = (
+            [m for m in self.eternal_markers if m in text_lower],
+            [m for m in self.enduring_markers if m in text_lower],
+            [m for m in self.ephemeral_markers if m in text_lower],
+            [m for m in self.immediate_markers if m in text_lower],
+        )
+        metaphor_count = len(set(self._metaphor_re.findall(text_lower)))
+        literal_count = sum(1 for pattern in self._literal_res if pattern.search(text))
+        return hits, metaphor_count, literal_count
+
     def compare_temporal_depth(self, text1: str, text2: str) -> Dict:
         """Compare temporal depth of two texts"""
         sig1 = self.analyze(text1)
@@ -7,17 +7,42 @@ Tests for cross-contextual truth detection via lens deviation.
 Demonstrates the Veritas distortion index D(P) in action.
 """
 
+import sys
+import textwrap
+
+import numpy as np
+
 from multi_lens_test import MultiLensRoseGlass
-from lens_interference import LensInterferenceAnalyzer, LensReading
+from lens_interference import LensInterferenceAnalyzer, LensReading, stack_readings, veritas_index
+
+
+# Banner rules, built once
+_RULE = "=" * 80
+_BOX_TOP = "╔" + "=" * 78 + "╗"
+_BOX_BOTTOM = "╚" + "=" * 78 + "╝"
+
+# Shared by every test - neither holds per-test state
+_GLASS = MultiLensRoseGlass(invariance_threshold=0.1)
+_ANALYZER = LensInterferenceAnalyzer()
+
+_KEY_INSIGHT = textwrap.dedent("""
+    Key Insight:
+      Lens deviation (σ_lens) = Veritas distortion index D(P)
+      Low σ_lens → Universal truth → Reset Fibonacci
+      High σ_lens → Context-dependent → Continue exploration
+
+      'The Fibonacci spiral follows epistemological confidence.'
+
+""")
 
 
 def test_multi_lens_deviation():
     """Test MultiLensRoseGlass lens deviation calculation"""
-    print("=" * 80)
+    print(_RULE)
     print("TEST 1: MultiLensRoseGlass Lens Deviation")
-    print("=" * 80)
+    print(_RULE)
 
-    glass = MultiLensRoseGlass(invariance_threshold=0.1)
+    glass = _GLASS
 
     # Test with different types of text
     texts = [
@@ -26,8 +51,10 @@ def test_multi_lens_deviation():
         ("Balanced", "The data shows a clear correlation between the variables."),
     ]
 
-    for label, text in texts:
-        deviation = glass.calculate_lens_deviation(text)
+    # All texts scored through every lens in one batched call
+    deviations = glass.calculate_lens_deviations([text for _, text in texts])
+
+    for (label, text), deviation in zip(texts, deviations):
         should_reset, dev = glass.should_reset_fibonacci(text)
 
         print(f"\n{label}:")
@@ -40,18 +67,18 @@ def test_multi_lens_deviation():
         else:
             print(f"  → EXPAND: Context-dependent (lenses disagree)")
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("✅ MultiLensRoseGlass tests passed!")
-    print("=" * 80)
+    print(_RULE)
 
 
 def test_lens_interference_analyzer():
     """Test LensInterferenceAnalyzer lens deviation and reset triggers"""
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("TEST 2: LensInterferenceAnalyzer Integration")
-    print("=" * 80)
+    print(_RULE)
 
-    analyzer = LensInterferenceAnalyzer()
+    analyzer = _ANALYZER
 
     # Universal pattern - all lenses agree (balanced)
     readings_universal = [
@@ -69,81 +96,82 @@ def test_lens_interference_analyzer():
         LensReading("Buddhist", psi=0.5, rho=0.8, q=0.3, f=0.6, pattern_intensity=0.55),
     ]
 
+    # Stack each panel once; the analyzer reads the arrays directly
+    stacked_universal = stack_readings(readings_universal)
+    stacked_activist = stack_readings(readings_activist)
+
     print("\n--- Universal Pattern ---")
-    deviation1 = analyzer.calculate_lens_deviation(readings_universal)
-    should_reset1, dev1 = analyzer.should_reset_fibonacci(readings_universal, 0.1)
+    should_reset1, deviation1 = analyzer.should_reset_fibonacci(stacked_universal, 0.1)
     print(f"Lens deviation: {deviation1:.4f}")
     print(f"Should reset: {should_reset1}")
     print(f"Interpretation: {'Universal truth - all lenses agree' if should_reset1 else 'Context-dependent'}")
 
     print("\n--- Context-Dependent Pattern ---")
-    deviation2 = analyzer.calculate_lens_deviation(readings_activist)
-    should_reset2, dev2 = analyzer.should_reset_fibonacci(readings_activist, 0.1)
+    should_reset2, deviation2 = analyzer.should_reset_fibonacci(stacked_activist, 0.1)
     print(f"Lens deviation: {deviation2:.4f}")
     print(f"Should reset: {should_reset2}")
     print(f"Interpretation: {'Universal truth' if should_reset2 else 'Context-dependent - lenses disagree'}")
 
     # Veritas calculation
     print("\n--- Veritas Distortion Index ---")
-    veritas1 = 1.0 / (1.0 + deviation1)
-    veritas2 = 1.0 / (1.0 + deviation2)
+    veritas1, veritas2 = veritas_index(np.array([deviation1, deviation2])).tolist()
     print(f"Universal pattern: D(P)={deviation1:.4f}, Veritas={veritas1:.4f}")
     print(f"Context-dependent: D(P)={deviation2:.4f}, Veritas={veritas2:.4f}")
     print(f"\nHigh Veritas = Low distortion = Universal truth")
     print(f"Low Veritas = High distortion = Context-dependent")
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("✅ LensInterferenceAnalyzer tests passed!")
-    print("=" * 80)
+    print(_RULE)
 
 
 def test_fibonacci_reset_threshold():
     """Test different invariance thresholds"""
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("TEST 3: Invariance Threshold Configuration")
-    print("=" * 80)
-
-    glass_strict = MultiLensRoseGlass(invariance_threshold=0.05)
-    glass_permissive = MultiLensRoseGlass(invariance_threshold=0.15)
+    print(_RULE)
 
     text = "The data indicates a correlation between the variables."
 
-    dev_strict = glass_strict.calculate_lens_deviation(text)
-    dev_permissive = glass_permissive.calculate_lens_deviation(text)
+    # The deviation doesn't depend on the threshold; only the reset does,
+    # so one shared glass is checked at each threshold and then restored
+    glass = _GLASS
+    deviation = glass.calculate_lens_deviation(text)
 
-    reset_strict, _ = glass_strict.should_reset_fibonacci(text)
-    reset_permissive, _ = glass_permissive.should_reset_fibonacci(text)
+    default_threshold = glass.invariance_threshold
+    try:
+        glass.invariance_threshold = 0.05
+        reset_strict, _ = glass.should_reset_fibonacci(text)
+        glass.invariance_threshold = 0.15
+        reset_permissive, _ = glass.should_reset_fibonacci(text)
+    finally:
+        glass.invariance_threshold = default_threshold
 
     print(f"\nText: {text}")
-    print(f"Lens deviation: {dev_strict:.4f}")
+    print(f"Lens deviation: {deviation:.4f}")
     print(f"\nStrict threshold (0.05): Reset = {reset_strict}")
     print(f"Permissive threshold (0.15): Reset = {reset_permissive}")
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("✅ Threshold configuration tests passed!")
-    print("=" * 80)
+    print(_RULE)
 
 
 def main():
     """Run all tests"""
-    print("\n" + "╔" + "=" * 78 + "╗")
+    print("\n" + _BOX_TOP)
     print("║  Rose Glass LE - Lens Deviation & Fibonacci Reset Tests" + " " * 21 + "║")
-    print("╚" + "=" * 78 + "╝")
+    print(_BOX_BOTTOM)
 
     test_multi_lens_deviation()
     test_lens_interference_analyzer()
     test_fibonacci_reset_threshold()
 
-    print("\n" + "╔" + "=" * 78 + "╗")
+    print("\n" + _BOX_TOP)
     print("║  All Tests Passed!" + " " * 58 + "║")
-    print("╚" + "=" * 78 + "╝")
-
-    print("\nKey Insight:")
-    print("  Lens deviation (σ_lens) = Veritas distortion index D(P)")
-    print("  Low σ_lens → Universal truth → Reset Fibonacci")
-    print("  High σ_lens → Context-dependent → Continue exploration")
-    print("\n  'The Fibonacci spiral follows epistemological confidence.'")
-    print()
+    print(_BOX_BOTTOM)
+
+    sys.stdout.write(_KEY_INSIGHT)
 
 
 if __name__ == "__main__":
@@ -10,20 +10,46 @@ curves, activation thresholds, and dimensional coupling than neurotypical patter
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from enum import Enum
+from typing import Dict, List, Optional, Tuple
+from enum import IntEnum
 
+import numpy as np
 
-class NeurodivergenceType(Enum):
-    """Types of neurodivergent communication patterns"""
-    AUTISM_SPECTRUM = "autism_spectrum"
-    ADHD = "adhd"
-    DYSLEXIA = "dyslexia"
-    HIGH_STRESS_TRAUMA = "high_stress_trauma"  # For law enforcement/veteran contexts
-    GENERAL = "general"  # Parent class for all neurodivergent patterns
 
+# Dimension order of every priority vector
+_DIMENSIONS = ('psi', 'rho', 'q', 'f')
 
-@dataclass
+
+def _priority_vector(priorities: Dict[str, float]) -> np.ndarray:
+    """Read-only float32 (psi, rho, q, f) vector of a priorities mapping"""
+    vec = np.array([priorities[dim] for dim in _DIMENSIONS], dtype=np.float32)
+    vec.setflags(write=False)
+    return vec
+
+
+# Priority bar strings for the demo display, one per 0.05 of weight up to 2.0
+_BARS = tuple('█' * i for i in range(41))
+
+
+class NeurodivergenceType(IntEnum):
+    """
+    Types of neurodivergent communication patterns
+
+    Integer tags, so dispatch on type compares and hashes as plain ints;
+    label gives the display name ("autism_spectrum", ...).
+    """
+    AUTISM_SPECTRUM = 1
+    ADHD = 2
+    DYSLEXIA = 3
+    HIGH_STRESS_TRAUMA = 4  # For law enforcement/veteran contexts
+    GENERAL = 5  # Parent class for all neurodivergent patterns
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+@dataclass(slots=True)
 class CulturalCalibration:
     """Base cultural calibration (from original Rose Glass)"""
     name: str
@@ -31,13 +57,10 @@ class CulturalCalibration:
     km: float = 0.3  # Saturation curve midpoint
     ki: float = 2.0  # Inhibition threshold
     coupling_strength: float = 0.15  # Cross-dimensional coupling
-    expected_patterns: Dict[str, str] = None
+    # Read-only (pattern type, description) pairs, in display order
+    expected_patterns: Tuple[Tuple[str, str], ...] = ()
     breathing_pattern: str = "standard"
 
-    def __post_init__(self):
-        if self.expected_patterns is None:
-            self.expected_patterns = {}
-
 
 class NeurodivergentCalibration(CulturalCalibration):
     """
@@ -50,25 +73,46 @@ class NeurodivergentCalibration(CulturalCalibration):
     - May prioritize different dimensions
     """
 
+    __slots__ = ('neurodivergence_type', 'dimension_priorities')
+
+    # Dimension priorities (weights when ambiguous) - neutral by default.
+    # Subclasses override this mapping only; PRIORITIES is derived from it.
+    DIMENSION_PRIORITIES = {'psi': 1.0, 'rho': 1.0, 'q': 1.0, 'f': 1.0}
+
+    # The same priorities as a read-only (psi, rho, q, f) weight vector,
+    # shared by every instance, for scoring readings with one multiply
+    PRIORITIES = _priority_vector(DIMENSION_PRIORITIES)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.PRIORITIES = _priority_vector(cls.DIMENSION_PRIORITIES)
+
     def __init__(self, neurodivergence_type: NeurodivergenceType):
         self.neurodivergence_type = neurodivergence_type
 
         # Base parameters - overridden by specific subclasses
         super().__init__(
-            name=f"Neurodivergent ({neurodivergence_type.value})",
+            name=f"Neurodivergent ({neurodivergence_type.label})",
             description="Base neurodivergent communication calibration",
             km=0.35,
             ki=0.65,
             coupling_strength=0.25,
-            expected_patterns={
-                'reasoning': 'may show different logical patterns',
-                'moral_expression': 'emotional regulation may differ',
-                'social_architecture': 'different belonging signals',
-                'wisdom_integration': 'pattern-based rather than narrative'
-            },
+            expected_patterns=(
+                ('reasoning', 'may show different logical patterns'),
+                ('moral_expression', 'emotional regulation may differ'),
+                ('social_architecture', 'different belonging signals'),
+                ('wisdom_integration', 'pattern-based rather than narrative'),
+            ),
             breathing_pattern="variable - atypical pause and rhythm patterns"
         )
 
+        # Per-instance copy of the class priorities
+        self.dimension_priorities = dict(self.DIMENSION_PRIORITIES)
+
+    def priority_vec(self) -> np.ndarray:
+        """Class dimension priorities as a read-only float32 (psi, rho, q, f) vector"""
+        return self.PRIORITIES
+
 
 class AutismSpectrumCalibration(NeurodivergentCalibration):
     """
@@ -82,6 +126,16 @@ class AutismSpectrumCalibration(NeurodivergentCalibration):
     - May have different saturation curves for emotional activation
     """
 
+    __slots__ = ()
+
+    # Dimension priorities (weights when ambiguous)
+    DIMENSION_PRIORITIES = {
+        'psi': 1.3,  # Higher weight on internal consistency
+        'rho': 1.1,  # Pattern-based wisdom valued
+        'q': 0.9,    # Direct but may be filtered less
+        'f': 0.7     # Social harmony weighted lower
+    }
+
     def __init__(self):
         super().__init__(NeurodivergenceType.AUTISM_SPECTRUM)
 
@@ -97,25 +151,17 @@ class AutismSpectrumCalibration(NeurodivergentCalibration):
         self.coupling_strength = 0.20  # Moderate coupling
 
         # Expected patterns
-        self.expected_patterns = {
-            'reasoning': 'High logical consistency priority - may value Ψ > f',
-            'moral_expression': 'Direct and honest - less social performance filtering',
-            'social_architecture': 'Different belonging signals - clarity over harmony',
-            'wisdom_integration': 'Pattern-recognition based - systematic rather than narrative',
-            'emotional_regulation': 'May show delayed or intense emotional expression',
-            'communication_style': 'Precise language, literal interpretation common'
-        }
+        self.expected_patterns = (
+            ('reasoning', 'High logical consistency priority - may value Ψ > f'),
+            ('moral_expression', 'Direct and honest - less social performance filtering'),
+            ('social_architecture', 'Different belonging signals - clarity over harmony'),
+            ('wisdom_integration', 'Pattern-recognition based - systematic rather than narrative'),
+            ('emotional_regulation', 'May show delayed or intense emotional expression'),
+            ('communication_style', 'Precise language, literal interpretation common'),
+        )
 
         self.breathing_pattern = "detailed - may include extensive contextual information"
 
-        # Dimension priorities (weights when ambiguous)
-        self.dimension_priorities = {
-            'psi': 1.3,  # Higher weight on internal consistency
-            'rho': 1.1,  # Pattern-based wisdom valued
-            'q': 0.9,    # Direct but may be filtered less
-            'f': 0.7     # Social harmony weighted lower
-        }
-
 
 class ADHDCalibration(NeurodivergentCalibration):
     """
@@ -129,6 +175,16 @@ class ADHDCalibration(NeurodivergentCalibration):
     - Variable attention creates different temporal patterns
     """
 
+    __slots__ = ()
+
+    # Dimension priorities (weights when ambiguous)
+    DIMENSION_PRIORITIES = {
+        'psi': 0.8,  # May appear lower due to associative style
+        'rho': 1.2,  # Rich associative connections
+        'q': 1.4,    # High emotional activation
+        'f': 1.3     # Strong relationship focus
+    }
+
     def __init__(self):
         super().__init__(NeurodivergenceType.ADHD)
 
@@ -144,25 +200,17 @@ class ADHDCalibration(NeurodivergentCalibration):
         self.coupling_strength = 0.35  # Higher coupling - dimensions interact more
 
         # Expected patterns
-        self.expected_patterns = {
-            'reasoning': 'Associative rather than linear - may appear fragmented but internally coherent',
-            'moral_expression': 'Intense and variable - rapid emotional shifts',
-            'social_architecture': 'High engagement with relationships and connection',
-            'wisdom_integration': 'Associative leaps - connects distant concepts',
-            'attention_pattern': 'Hyperfocus alternates with distributed attention',
-            'communication_style': 'Rapid idea generation, topic shifting'
-        }
+        self.expected_patterns = (
+            ('reasoning', 'Associative rather than linear - may appear fragmented but internally coherent'),
+            ('moral_expression', 'Intense and variable - rapid emotional shifts'),
+            ('social_architecture', 'High engagement with relationships and connection'),
+            ('wisdom_integration', 'Associative leaps - connects distant concepts'),
+            ('attention_pattern', 'Hyperfocus alternates with distributed attention'),
+            ('communication_style', 'Rapid idea generation, topic shifting'),
+        )
 
         self.breathing_pattern = "rapid bursts - high energy shifts with pauses"
 
-        # Dimension priorities
-        self.dimension_priorities = {
-            'psi': 0.8,  # May appear lower due to associative style
-            'rho': 1.2,  # Rich associative connections
-            'q': 1.4,    # High emotional activation
-            'f': 1.3     # Strong relationship focus
-        }
-
 
 class HighStressTraumaCalibration(NeurodivergentCalibration):
     """
@@ -178,6 +226,16 @@ class HighStressTraumaCalibration(NeurodivergentCalibration):
     - May prioritize clarity and directness over social niceties
     """
 
+    __slots__ = ('stress_indicators',)
+
+    # Dimension priorities (weights when ambiguous)
+    DIMENSION_PRIORITIES = {
+        'psi': 1.1,  # Consistency valued for predictability
+        'rho': 1.2,  # Experience-based wisdom
+        'q': 1.5,    # Heightened emotional vigilance
+        'f': 1.3     # Strong in-group cohesion
+    }
+
     def __init__(self):
         super().__init__(NeurodivergenceType.HIGH_STRESS_TRAUMA)
 
@@ -193,25 +251,17 @@ class HighStressTraumaCalibration(NeurodivergentCalibration):
         self.coupling_strength = 0.40  # High coupling - stress affects all dimensions
 
         # Expected patterns
-        self.expected_patterns = {
-            'reasoning': 'Tactical and compressed - efficiency prioritized',
-            'moral_expression': 'May be guarded or intense - threat-aware',
-            'social_architecture': 'In-group/out-group distinction heightened',
-            'wisdom_integration': 'Experience-based - survival knowledge',
-            'emotional_regulation': 'May show hypervigilance or numbing',
-            'communication_style': 'Direct, clear, action-oriented'
-        }
+        self.expected_patterns = (
+            ('reasoning', 'Tactical and compressed - efficiency prioritized'),
+            ('moral_expression', 'May be guarded or intense - threat-aware'),
+            ('social_architecture', 'In-group/out-group distinction heightened'),
+            ('wisdom_integration', 'Experience-based - survival knowledge'),
+            ('emotional_regulation', 'May show hypervigilance or numbing'),
+            ('communication_style', 'Direct, clear, action-oriented'),
+        )
 
         self.breathing_pattern = "tactical - short bursts with heightened awareness"
 
-        # Dimension priorities
-        self.dimension_priorities = {
-            'psi': 1.1,  # Consistency valued for predictability
-            'rho': 1.2,  # Experience-based wisdom
-            'q': 1.5,    # Heightened emotional vigilance
-            'f': 1.3     # Strong in-group cohesion
-        }
-
         # Stress indicators (for real-time monitoring)
         self.stress_indicators = {
             'vocabulary': ['threat', 'danger', 'watch', 'careful', 'aware'],
@@ -220,6 +270,38 @@ class HighStressTraumaCalibration(NeurodivergentCalibration):
         }
 
 
+
+# Shared calibration instances - their parameters are configuration
+# constants, so scoring code can use these instead of rebuilding one per call
+AUTISM_CAL = AutismSpectrumCalibration()
+ADHD_CAL = ADHDCalibration()
+STRESS_CAL = HighStressTraumaCalibration()
+
+# The shared calibrations packed into one float32 record array, one row per
+# calibration, so selection and scoring across calibrations is vectorized:
+# e.g. CALIBRATION_TABLE.km, or readings (N, 4) * PRIORITY_MATRIX[:, None, :].
+# Built from the instances above, so the classes stay the single source.
+CALIBRATION_TABLE = np.rec.fromrecords(
+    [(cal.neurodivergence_type.label, cal.km, cal.ki, cal.coupling_strength, *cal.PRIORITIES)
+     for cal in (AUTISM_CAL, ADHD_CAL, STRESS_CAL)],
+    dtype=[('name', 'U32'), ('km', np.float32), ('ki', np.float32), ('coupling', np.float32),
+           ('psi_w', np.float32), ('rho_w', np.float32), ('q_w', np.float32), ('f_w', np.float32)]
+)
+PRIORITY_MATRIX = np.stack([cal.PRIORITIES for cal in (AUTISM_CAL, ADHD_CAL, STRESS_CAL)])
+CALIBRATION_TABLE.setflags(write=False)
+PRIORITY_MATRIX.setflags(write=False)
+
+# Shared calibration by type tag
+_CAL_BY_TAG: Dict[int, CulturalCalibration] = {
+    cal.neurodivergence_type: cal for cal in (AUTISM_CAL, ADHD_CAL, STRESS_CAL)
+}
+
+
+def calibration_for(neurodivergence_type: NeurodivergenceType) -> Optional[CulturalCalibration]:
+    """Shared calibration for a neurodivergence type, or None if it has none"""
+    return _CAL_BY_TAG.get(neurodivergence_type)
+
+
 def test_neurodivergent_calibrations():
     """Test different neurodivergent calibrations"""
 
@@ -229,17 +311,13 @@ def test_neurodivergent_calibrations():
     print("\nCritical for DEA Human Performance Services Application")
     print("Law enforcement populations include significant neurodivergent representation\n")
 
-    calibrations = [
-        AutismSpectrumCalibration(),
-        ADHDCalibration(),
-        HighStressTraumaCalibration()
-    ]
+    calibrations = [AUTISM_CAL, ADHD_CAL, STRESS_CAL]
 
     for cal in calibrations:
         print("─" * 90)
         print(f"🧠 {cal.name}")
         print("─" * 90)
-        print(f"Type: {cal.neurodivergence_type.value}")
+        print(f"Type: {cal.neurodivergence_type.label}")
         print(f"Description: {cal.description}")
         print(f"\nBiological Optimization Parameters:")
         print(f"  km (Saturation Midpoint):    {cal.km:.2f}")
@@ -248,14 +326,13 @@ def test_neurodivergent_calibrations():
         print(f"\nBreathing Pattern: {cal.breathing_pattern}")
 
         print(f"\nExpected Communication Patterns:")
-        for pattern_type, description in cal.expected_patterns.items():
+        for pattern_type, description in cal.expected_patterns:
             print(f"  • {pattern_type:25} {description}")
 
-        if hasattr(cal, 'dimension_priorities'):
-            print(f"\nDimension Priorities (when ambiguous):")
-            for dim, weight in cal.dimension_priorities.items():
-                bar = '█' * int(weight * 20)
-                print(f"  {dim:5} {weight:.1f} {bar}")
+        print(f"\nDimension Priorities (when ambiguous):")
+        for dim, weight in cal.dimension_priorities.items():
+            bar = _BARS[min(len(_BARS) - 1, int(weight * 20))]
+            print(f"  {dim:5} {weight:.1f} {bar}")
 
         print()
 
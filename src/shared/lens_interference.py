@@ -52,6 +52,15 @@ class InterferenceAnalysis:
     interpretation_stability: float    # How stable across lenses (inverse of λ)
     
 
+def _lambda_from_coherences(coherences: List[float]) -> float:
+    """
+    λ from per-lens coherences: their standard deviation, normalized to 0-1
+    (assuming max practical std ~0.3). A single lens has no interference.
+    """
+    lambda_coefficient = np.std(coherences) if len(coherences) > 1 else 0.0
+    return min(lambda_coefficient / 0.3, 1.0)
+
+
 class LensInterferenceAnalyzer:
     """
     Analyzes interference patterns across cultural lenses.
@@ -171,11 +180,8 @@ class LensInterferenceAnalyzer:
                 weight_profile=self.lenses[lens_name]
             )
         
-        # Calculate lambda (standard deviation of coherences)
-        lambda_coefficient = np.std(coherences) if len(coherences) > 1 else 0.0
-        
-        # Normalize to 0-1 range (assuming max practical std ~0.3)
-        lambda_normalized = min(lambda_coefficient / 0.3, 1.0)
+        # Calculate lambda (normalized standard deviation of coherences)
+        lambda_normalized = _lambda_from_coherences(coherences)
         
         # Determine interference type
         interference_type = self._classify_interference(coherences)
@@ -272,8 +278,12 @@ class LensInterferenceAnalyzer:
         Returns:
             Standard deviation of coherences (0-1 normalized)
         """
-        analysis = self.analyze_interference(psi, rho, q, f)
-        return analysis.lambda_coefficient
+        # Same λ as analyze_interference, without building readings, lens
+        # pairs and recommendations that this path discards
+        return _lambda_from_coherences([
+            self.calculate_lens_coherence(psi, rho, q, f, lens_name)
+            for lens_name in self.lenses
+        ])
     
     def is_lens_invariant(
         self,
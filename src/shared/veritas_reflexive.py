@@ -499,6 +499,15 @@ class MirrorWing:
         
         return result
     
+    def reflect_numeric(self, label: str, value: float) -> ReflectionResult:
+        """
+        Reflection of a "label: value" reading, e.g. a predicted level.
+        
+        Formats the reading the way callers have always phrased it and runs
+        the full reflect() cycle on it.
+        """
+        return self.reflect(f"{label}: {value:.2f}")
+    
     def _invert_sentiment(self, text: str) -> str:
         """Simple sentiment inversion for demonstration"""
         inversions = {
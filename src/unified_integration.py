@@ -25,10 +25,13 @@ Author: Christopher MacGregor bin Joseph
 Date: December 2025
 """
 
+from bisect import bisect_right
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+import time
 import numpy as np
 
 # Import unified shared modules
@@ -69,15 +72,55 @@ from .temporal_dimension import TemporalAnalyzer as LETemporalAnalyzer
 from .lens_interference import LensInterferenceAnalyzer as LEInterferenceAnalyzer
 
 
-class InterventionConfidence(Enum):
-    """Confidence levels for intervention recommendations"""
-    LOW = "low"           # Veritas < 0.4
-    MODERATE = "moderate" # 0.4 <= Veritas < 0.6
-    HIGH = "high"         # 0.6 <= Veritas < 0.8
-    CRITICAL = "critical" # Veritas >= 0.8
+class InterventionConfidence(IntEnum):
+    """
+    Confidence levels for intervention recommendations
+    
+    Ordered integer bands, so levels compare and hash as plain ints;
+    label gives the display name ("low", "moderate", ...).
+    """
+    LOW = 0       # Veritas < 0.4
+    MODERATE = 1  # 0.4 <= Veritas < 0.6
+    HIGH = 2      # 0.6 <= Veritas < 0.8
+    CRITICAL = 3  # Veritas >= 0.8
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# Veritas cut points and the confidence each band maps to; a value equal to
+# a cut point belongs to the band above it
+_VERITAS_BINS = (0.4, 0.6, 0.8)
+_CONF_TABLE = tuple(InterventionConfidence)
+
+
+def _confidence_from_veritas(veritas: float) -> InterventionConfidence:
+    """Map a Veritas score to its intervention confidence band"""
+    return _CONF_TABLE[bisect_right(_VERITAS_BINS, veritas)]
 
 
-@dataclass
+# Value -> member maps for the enum fields of a rotate() result, which
+# carries enum values (or None) rather than members
+_TRUTH_TYPES = {t.value: t for t in TruthType}
+_RESET_TRIGGERS = {t.value: t for t in ResetTrigger}
+
+
+# Officer impact assessments, from calmest to most urgent
+_OFFICER_IMPACTS = (
+    "Stable - continue routine monitoring",
+    "Moderate stress - awareness recommended",
+    "Elevated stress - monitoring advised",
+    "High stress, high confidence - immediate support needed",
+)
+
+
+# Retention caps for the tracker archives; the oldest entries drop off first
+_STRESS_FRAGMENT_CAP = 4096
+_LE_DISCOVERY_CAP = 1024
+
+
+@dataclass(slots=True)
 class EnhancedPrediction:
     """Enhanced prediction with Veritas confidence"""
     # Base prediction
@@ -104,7 +147,7 @@ class EnhancedPrediction:
     lambda_coef: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LEPatternDiscovery:
     """Pattern discovery specific to law enforcement context"""
     discovery: TruthDiscovery
@@ -155,11 +198,33 @@ class EnhancedGradientTracker(PatternGradientTracker):
         self.validation.veritas.stability_threshold = stability_threshold
         
         # Pattern archive
-        self.le_discoveries: List[LEPatternDiscovery] = []
+        self.le_discoveries: Deque[LEPatternDiscovery] = deque(maxlen=_LE_DISCOVERY_CAP)
         
-        # Stress pattern fragments for Architect integration
-        self.stress_fragments: List[InsightFragment] = []
+        # High-stress samples for Architect integration, kept raw as
+        # (q, coherence, source, unix time) and turned into fragments on read
+        self._stress_samples: Deque[Tuple[float, float, str, float]] = deque(
+            maxlen=_STRESS_FRAGMENT_CAP
+        )
         
+    @property
+    def stress_fragments(self) -> List[InsightFragment]:
+        """
+        Buffered high-stress samples as Architect fragments, oldest first
+        
+        Formatted from the raw samples on each access - meant for
+        integration and inspection, not for per-tick use.
+        """
+        return [
+            InsightFragment(
+                content=f"High stress detected: q={q:.2f}",
+                source=source,
+                coherence=coherence,
+                timestamp=datetime.fromtimestamp(ts),
+                domain="stress_monitoring"
+            )
+            for q, coherence, source, ts in self._stress_samples
+        ]
+    
     def track_enhanced(
         self,
         psi: float,
@@ -195,14 +260,7 @@ class EnhancedGradientTracker(PatternGradientTracker):
         )
         
         # Determine intervention confidence
-        if veritas >= 0.8:
-            confidence = InterventionConfidence.CRITICAL
-        elif veritas >= 0.6:
-            confidence = InterventionConfidence.HIGH
-        elif veritas >= 0.4:
-            confidence = InterventionConfidence.MODERATE
-        else:
-            confidence = InterventionConfidence.LOW
+        confidence = _confidence_from_veritas(veritas)
         
         # Check for pattern discovery
         if learning_result['truth_discovered']:
@@ -214,28 +272,100 @@ class EnhancedGradientTracker(PatternGradientTracker):
                 confidence
             )
         
-        # Store stress fragment for Architect
+        # Store stress sample for Architect
         if q > 0.6:  # High stress
-            self.stress_fragments.append(InsightFragment(
-                content=f"High stress detected: q={q:.2f}",
-                source=context,
-                coherence=learning_result['coherence'],
-                timestamp=datetime.now(),
-                domain="stress_monitoring"
-            ))
+            self._stress_samples.append(
+                (q, learning_result['coherence'], context, time.time())
+            )
         
         return {
             **base_result,
             'tau': tau,
             'lambda': lambda_coef,
             'veritas': veritas,
-            'intervention_confidence': confidence.value,
+            'intervention_confidence': confidence.label,
             'fibonacci_angle': learning_result['current_angle'],
             'truth_discovered': learning_result['truth_discovered'],
             'truth_type': learning_result['truth_type'],
             'learning_resets': learning_result['learning_resets']
         }
     
+    def track_enhanced_batch(
+        self,
+        psi: np.ndarray,
+        rho: np.ndarray,
+        q: np.ndarray,
+        f: np.ndarray,
+        tau: np.ndarray,
+        lambda_coef: np.ndarray,
+        timestamps: np.ndarray,
+        context: str = "replay"
+    ) -> Dict[str, Any]:
+        """
+        Tracking for a batch of samples (log replay, multi-officer feeds).
+        
+        Fibonacci rotation is stateful, so samples go through the learner
+        one at a time in order, and discoveries and stress samples are
+        recorded exactly as track_enhanced records them, stamped with the
+        samples' own times. Veritas, intervention confidence and window are
+        computed in whole-array operations; base tracking is not replayed, so
+        Veritas scores the plain dimension mean, track_enhanced's fallback.
+        
+        Args:
+            psi, rho, q, f: Core GCT variables, one entry per sample
+            tau: Temporal depth per sample
+            lambda_coef: Lens interference per sample
+            timestamps: Sample times as unix seconds
+            context: LE context string
+        
+        Returns:
+            Dict of per-sample arrays plus confidence labels
+        """
+        psi, rho, q, f, tau, lambda_coef, timestamps = (
+            np.asarray(a, dtype=float)
+            for a in (psi, rho, q, f, tau, lambda_coef, timestamps)
+        )
+        
+        coherence = (psi + rho + q + f) / 4
+        veritas = self.validation.veritas.quick_veritas(
+            distortion_index=lambda_coef,
+            composite_score=coherence
+        )
+        conf_idx = np.searchsorted(_VERITAS_BINS, veritas, side='right')
+        intervention_window = np.maximum(60 - q * 40, 10)
+        high_stress = q > 0.6
+        
+        n = len(q)
+        angles = np.empty(n)
+        discovered = np.zeros(n, dtype=bool)
+        samples = zip(psi.tolist(), rho.tolist(), q.tolist(), f.tolist(),
+                      veritas.tolist(), conf_idx.tolist(), timestamps.tolist())
+        for i, (psi_i, rho_i, q_i, f_i, veritas_i, conf_i, ts) in enumerate(samples):
+            learning_result = self.fibonacci.rotate(psi_i, rho_i, q_i, f_i)
+            angles[i] = learning_result['current_angle']
+            
+            if learning_result['truth_discovered']:
+                discovered[i] = True
+                self._record_le_discovery(
+                    learning_result, context, q_i, veritas_i, _CONF_TABLE[conf_i], timestamp=ts
+                )
+            
+            if q_i > 0.6:  # High stress
+                self._stress_samples.append((q_i, learning_result['coherence'], context, ts))
+        
+        return {
+            'coherence': coherence,
+            'tau': tau,
+            'lambda': lambda_coef,
+            'veritas': veritas,
+            'confidence_index': conf_idx,
+            'intervention_confidence': [_CONF_TABLE[i].label for i in conf_idx.tolist()],
+            'intervention_window': intervention_window,
+            'high_stress': high_stress,
+            'fibonacci_angle': angles,
+            'truth_discovered': discovered
+        }
+    
     def predict_enhanced(
         self,
         time_horizon: float = 30.0
@@ -262,19 +392,15 @@ class EnhancedGradientTracker(PatternGradientTracker):
         )
         
         # Determine confidence
-        if veritas >= 0.8:
-            confidence = InterventionConfidence.CRITICAL
-        elif veritas >= 0.6:
-            confidence = InterventionConfidence.HIGH
-        elif veritas >= 0.4:
-            confidence = InterventionConfidence.MODERATE
-        else:
-            confidence = InterventionConfidence.LOW
+        confidence = _confidence_from_veritas(veritas)
         
-        # Validate prediction through Mirror
-        reflection = self.validation.mirror.reflect(
-            f"Predicted stress level: {base_pred.get('predicted_q', 0):.2f}"
-        )
+        # Validate prediction through Mirror; a LOW-confidence prediction
+        # is not actionable, so it is never treated as stable
+        is_stable = False
+        if confidence is not InterventionConfidence.LOW:
+            is_stable = self.validation.mirror.reflect_numeric(
+                "Predicted stress level", base_pred.get('predicted_q', 0)
+            ).is_stable
         
         return EnhancedPrediction(
             predicted_q=base_pred.get('predicted_q', 0),
@@ -284,7 +410,7 @@ class EnhancedGradientTracker(PatternGradientTracker):
             intervention_type=base_pred.get('intervention_type', 'monitor'),
             intervention_confidence=confidence,
             veritas_score=veritas,
-            is_stable_prediction=reflection.is_stable,
+            is_stable_prediction=is_stable,
             fibonacci_angle=state.current_angle,
             pattern_discovered=state.truths_discovered > 0,
             pattern_type=None,  # Would come from latest discovery
@@ -298,9 +424,10 @@ class EnhancedGradientTracker(PatternGradientTracker):
         context: str,
         q: float,
         veritas: float,
-        confidence: InterventionConfidence
+        confidence: InterventionConfidence,
+        timestamp: Optional[float] = None
     ):
-        """Record law enforcement specific pattern discovery"""
+        """Record law enforcement specific pattern discovery (timestamp defaults to now)"""
         # Determine LE context
         if q > 0.8:
             le_context = 'crisis'
@@ -319,10 +446,10 @@ class EnhancedGradientTracker(PatternGradientTracker):
             discovery=TruthDiscovery(
                 angle=learning_result['current_angle'],
                 coherence=learning_result['coherence'],
-                truth_type=TruthType(learning_result['truth_type']) if learning_result['truth_type'] else TruthType.PATTERN_RECOGNITION,
-                reset_trigger=ResetTrigger(learning_result['reset_trigger']) if learning_result['reset_trigger'] else ResetTrigger.PATTERN_RECOGNITION,
+                truth_type=_TRUTH_TYPES.get(learning_result['truth_type'], TruthType.PATTERN_RECOGNITION),
+                reset_trigger=_RESET_TRIGGERS.get(learning_result['reset_trigger'], ResetTrigger.PATTERN_RECOGNITION),
                 insight=f"LE Pattern: {le_context}",
-                timestamp=datetime.now().timestamp(),
+                timestamp=time.time() if timestamp is None else timestamp,
                 rotation_factor=learning_result['rotation_factor'],
                 reset_count=learning_result['learning_resets'],
                 lens_deviation=learning_result['lens_deviation'],
@@ -339,13 +466,13 @@ class EnhancedGradientTracker(PatternGradientTracker):
     def _assess_officer_impact(self, q: float, veritas: float) -> str:
         """Assess impact on officer based on stress and confidence"""
         if q > 0.8 and veritas > 0.7:
-            return "High stress, high confidence - immediate support needed"
+            return _OFFICER_IMPACTS[3]
         elif q > 0.6 and veritas > 0.5:
-            return "Elevated stress - monitoring advised"
+            return _OFFICER_IMPACTS[2]
         elif q < 0.3:
-            return "Stable - continue routine monitoring"
+            return _OFFICER_IMPACTS[0]
         else:
-            return "Moderate stress - awareness recommended"
+            return _OFFICER_IMPACTS[1]
     
     def integrate_stress_patterns(self) -> IntegratedInsight:
         """Use Architect to integrate stress patterns"""
@@ -356,26 +483,22 @@ class EnhancedGradientTracker(PatternGradientTracker):
     
     def get_le_discoveries(self) -> List[LEPatternDiscovery]:
         """Get all law enforcement pattern discoveries"""
-        return self.le_discoveries
+        return list(self.le_discoveries)
     
     def get_discovery_summary(self) -> Dict[str, Any]:
         """Get summary of all discoveries"""
         base_summary = self.fibonacci.get_discovery_summary()
         
-        # Add LE-specific summary
-        le_contexts = {}
-        confidence_dist = {}
-        
-        for d in self.le_discoveries:
-            le_contexts[d.le_context] = le_contexts.get(d.le_context, 0) + 1
-            confidence_dist[d.confidence.value] = confidence_dist.get(d.confidence.value, 0) + 1
+        # Add LE-specific summary (Counter tallies in C, keeping first-seen order)
+        le_contexts = Counter(d.le_context for d in self.le_discoveries)
+        confidence_dist = Counter(d.confidence for d in self.le_discoveries)
         
         return {
             **base_summary,
             'le_discoveries': len(self.le_discoveries),
-            'le_context_distribution': le_contexts,
-            'confidence_distribution': confidence_dist,
-            'stress_fragments': len(self.stress_fragments)
+            'le_context_distribution': dict(le_contexts),
+            'confidence_distribution': {c.label: n for c, n in confidence_dist.items()},
+            'stress_fragments': len(self._stress_samples)
         }
 
 
@@ -405,6 +528,9 @@ class EnhancedNeurodivergentCalibration:
         self.validation = ReflexiveValidationSystem()
         self.validation.veritas.stability_threshold = stability_threshold
         
+        # Stateless across calls, so one analyzer serves every validation
+        self._interference = LensInterferenceAnalyzer()
+        
     def validate_response(
         self,
         response: str,
@@ -421,18 +547,27 @@ class EnhancedNeurodivergentCalibration:
             psi, rho, q, f: GCT variables of communication context
             
         Returns:
-            Validation result with recommendations
+            Validation result with recommendations. A response that fails
+            the ND check is rejected before lens/Veritas scoring, so its
+            veritas_score and resonance_score are None.
         """
+        # ND-specific checks first - cheapest, and failing them decides the result
+        nd_appropriate = self._check_nd_appropriateness(response, self.base)
+        if not nd_appropriate:
+            return {
+                'is_valid': False,
+                'veritas_score': None,
+                'resonance_score': None,
+                'nd_appropriate': False,
+                'recommendations': ["Adjust response length/complexity for calibration"]
+            }
+        
         # Get lens deviation
-        interference = LensInterferenceAnalyzer()
-        deviation = interference.calculate_lens_deviation(psi, rho, q, f)
+        deviation = self._interference.calculate_lens_deviation(psi, rho, q, f)
         
         # Validate through full system
         validation = self.validation.validate_insight(response, deviation)
         
-        # Additional ND-specific checks
-        nd_appropriate = self._check_nd_appropriateness(response, self.base)
-        
         return {
             'is_valid': validation['is_validated'] and nd_appropriate,
             'veritas_score': validation['veritas_score'],
@@ -446,11 +581,10 @@ class EnhancedNeurodivergentCalibration:
     def _check_nd_appropriateness(self, response: str, calibration: Any) -> bool:
         """Check response against neurodivergent calibration rules"""
         # Basic checks - would be extended based on specific calibration
-        word_count = len(response.split())
         
-        # Check length appropriateness
+        # Check length appropriateness; words are only counted when a limit is set
         if hasattr(calibration, 'max_response_length'):
-            if word_count > calibration.max_response_length:
+            if len(response.split()) > calibration.max_response_length:
                 return False
         
         return True